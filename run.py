@@ -216,6 +216,10 @@ def resolve_asset_path(path: str | Path) -> Path:
         
     return base / path
 
+# Uygulama ikonu: yol ve varlık kontrolü modül yüklenirken bir kez çözülür
+_ICON_PATH = resolve_asset_path("icon.ico")
+_ICON_EXISTS = _ICON_PATH.exists()
+
 # Set working directory to where the executable is (for relative config/output paths)
 WORK_DIR = get_base_dir()
 os.chdir(WORK_DIR)
@@ -304,10 +308,10 @@ def main() -> int:
         app.setApplicationVersion(VERSION)
 
         # Set application icon
-        icon_path = resolve_asset_path("icon.ico")
+        icon_path = _ICON_PATH
         app_icon = QIcon()
         
-        if icon_path.exists():
+        if _ICON_EXISTS:
             print(f"[INFO] Loading icon from: {icon_path}")
             app_icon = QIcon(str(icon_path))
             if not app_icon.isNull():
@@ -364,13 +368,13 @@ def main() -> int:
         # Force icon on the root window (Fix for Windows taskbar)
         if engine.rootObjects():
             root_window = engine.rootObjects()[0]
-            if icon_path.exists() and not app_icon.isNull():
+            if _ICON_EXISTS and not app_icon.isNull():
                 root_window.setIcon(app_icon)
                 # app.setWindowIcon(app_icon) # Redundant
             
             # Explicitly force window creation to get HWND before showing
             # This ensures the icon is applied at the OS level before the window appears
-            if sys.platform == "win32" and icon_path.exists():
+            if sys.platform == "win32" and _ICON_EXISTS:
                 try:
                     import ctypes
                     from ctypes import wintypes
@@ -14,9 +14,9 @@ import threading
 import asyncio
 import time
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty, QUrl, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty, QUrl, QThread, QCoreApplication, QTimer
 from PyQt6.QtGui import QDesktopServices
 
 from src.utils.config import ConfigManager
@@ -38,6 +38,42 @@ if TYPE_CHECKING:
 from src.utils.data_transfer import export_glossary_to_file, import_glossary_from_file
 
 
+class UpdateCheckWorker(QObject):
+    """
+    Güncelleme kontrolünü kalıcı bir arka plan thread'inde çalıştırır.
+    
+    AppBackend tarafından bir kez oluşturulup QThread'e taşınır; her kontrolde
+    yeni thread açılmaz, istek kuyruklu sinyal ile check() slot'una iletilir.
+    """
+    
+    finished = pyqtSignal(object, str, bool)  # result, error, manual
+    
+    def __init__(self, version: str, config_dir: Optional[str] = None):
+        super().__init__()
+        self._version = version
+        self._config_dir = config_dir  # update_cache.json config.json ile aynı klasöre yazılır
+    
+    @pyqtSlot(bool)
+    def check(self, manual: bool):
+        try:
+            from src.utils.update_checker import check_for_updates, load_cached_result, save_cached_result
+            # Taze önbellek, hata durumunda eski sonuç: otomatik kontrolde taze önbellek varsa ağa hiç çıkma
+            if not manual:
+                cached = load_cached_result(self._version, config_dir=self._config_dir)
+                if cached is not None:
+                    self.finished.emit(cached, "", manual)
+                    return
+            result = check_for_updates(self._version)
+            if result.error:
+                # Ağ hatasında eski (stale) sonuç varsa onu göster
+                result = load_cached_result(self._version, max_age=None, config_dir=self._config_dir) or result
+            else:
+                save_cached_result(result, config_dir=self._config_dir)
+            self.finished.emit(result, "", manual)
+        except Exception as e:
+            self.finished.emit(None, str(e), manual)
+
+
 class AppBackend(QObject):
     """
     Python-QML köprüsü.
@@ -64,12 +100,31 @@ class AppBackend(QObject):
     initMessageChanged = pyqtSignal()
     busyChanged = pyqtSignal() # New signal for general busy state
     
+    # Pipeline aşaması -> arayüz metni anahtarı
+    _STAGE_TEXT_KEYS = {
+        "idle": "stage_idle", "validating": "stage_validating",
+        "unren": "stage_unren", "generating": "stage_generating",
+        "parsing": "stage_parsing", "translating": "stage_translating",
+        "saving": "stage_saving", "completed": "stage_completed",
+        "error": "stage_error"
+    }
+    
+    # Proje/motor/dil seçimlerinden sonra diske yazmadan önce beklenecek süre (ms)
+    SAVE_DEBOUNCE_MS = 400
+    
+    # Internal: update worker'ına kuyruklu istek (thread'ler arası otomatik QueuedConnection)
+    _updateCheckRequested = pyqtSignal(bool)
+    
     def __init__(self, config_manager: ConfigManager, parent=None):
         super().__init__(parent)
         self.config = config_manager
         self.logger = logging.getLogger(__name__)
         self._version = VERSION
         self._ui_trigger = False
+        # QML binding'leri aynı metni defalarca ister; dil değişince (refreshUI) temizlenir
+        self._ui_text_cache: Dict[Tuple[str, str], str] = {}
+        # ComboBox modelleri (dil/motor listeleri) aynı şekilde dil başına bir kez kurulur
+        self._ui_list_cache: Dict[object, list] = {}
         
         # State
         self._project_path = self.config.app_settings.last_input_directory or ""
@@ -85,6 +140,19 @@ class AppBackend(QObject):
         self.pipeline: Optional[TranslationPipeline] = None
         self.pipeline_worker: Optional[PipelineWorker] = None
         
+        # Update checker (ilk kontrolde oluşturulur, uygulama kapanana kadar yaşar)
+        self._update_thread: Optional[QThread] = None
+        self._update_worker: Optional[UpdateCheckWorker] = None
+        
+        # Config yazımları (SettingsBackend ile aynı şekilde) tek seferde toplanır
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.config.save_config)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_save)
+        
         # Managers
         self.proxy_manager = ProxyManager()
         self.proxy_manager.configure_from_settings(self.config.proxy_settings)
@@ -95,6 +163,17 @@ class AppBackend(QObject):
         # Initial Cache Load (Async call)
         self._update_cache_path_async()
 
+    def _schedule_save(self):
+        """Restart the debounce timer; config is written once the selections settle."""
+        self._save_timer.start()
+
+    @pyqtSlot()
+    def _flush_save(self):
+        """Write pending config changes now (application exit)."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.config.save_config()
+
     def _start_async_setup(self):
         """Move heavy engine setup to background thread."""
         threading.Thread(target=self._setup_translation_engines, daemon=True).start()
@@ -134,6 +213,8 @@ class AppBackend(QObject):
         # Local imports to avoid heavy startup load
         from src.core.ai_translator import OpenAITranslator, GeminiTranslator, LocalLLMTranslator
 
+        ts = self.config.translation_settings
+
         # 1. Google Translate (Web)
         google_translator = GoogleTranslator(
             proxy_manager=self.proxy_manager,
@@ -156,8 +237,8 @@ class AppBackend(QObject):
         # OpenAI her zaman ekle (Key boş olsa bile, kullanıcı sonradan girebilir)
         openai_translator = OpenAITranslator(
             api_key=openai_key or "dummy", # Key yoksa dummy ver, request anında kontrol edilebilir
-            model=getattr(self.config.translation_settings, 'openai_model', 'gpt-3.5-turbo'),
-            base_url=getattr(self.config.translation_settings, 'openai_base_url', None),
+            model=getattr(ts, 'openai_model', 'gpt-3.5-turbo'),
+            base_url=getattr(ts, 'openai_base_url', None),
             config_manager=self.config,
             proxy_manager=self.proxy_manager
         )
@@ -167,7 +248,7 @@ class AppBackend(QObject):
         gemini_key = self.config.get_api_key("gemini")
         gemini_translator = GeminiTranslator(
             api_key=gemini_key or "dummy",
-            model=getattr(self.config.translation_settings, 'gemini_model', 'gemini-2.0-flash-exp'),
+            model=getattr(ts, 'gemini_model', 'gemini-2.0-flash-exp'),
             config_manager=self.config
         )
         self.translation_manager.add_translator(TranslationEngine.GEMINI, gemini_translator)
@@ -176,8 +257,8 @@ class AppBackend(QObject):
 
         # 6. Local LLM
         local_translator = LocalLLMTranslator(
-            model=getattr(self.config.translation_settings, 'local_llm_model', 'llama3.2'),
-            base_url=getattr(self.config.translation_settings, 'local_llm_url', 'http://localhost:11434/v1'),
+            model=getattr(ts, 'local_llm_model', 'llama3.2'),
+            base_url=getattr(ts, 'local_llm_url', 'http://localhost:11434/v1'),
             config_manager=self.config
         )
         self.translation_manager.add_translator(TranslationEngine.LOCAL_LLM, local_translator)
@@ -185,6 +266,8 @@ class AppBackend(QObject):
     @pyqtSlot()
     def refreshUI(self):
         """Tüm arayüz metinlerini yenilemek için tetikleyiciyi değiştir."""
+        self._ui_text_cache.clear()
+        self._ui_list_cache.clear()
         self._ui_trigger = not self._ui_trigger
         self.languageRefresh.emit()
 
@@ -230,16 +313,26 @@ class AppBackend(QObject):
     @pyqtSlot(str, result=str)
     def getText(self, key: str) -> str:
         """Yerelleştirilmiş metin döndür."""
-        return self.config.get_ui_text(key, key)
+        return self.getTextWithDefault(key, key)
     
     @pyqtSlot(str, str, result=str)
     def getTextWithDefault(self, key: str, default: str) -> str:
         """Yerelleştirilmiş metin döndür, bulunamazsa default kullan."""
-        return self.config.get_ui_text(key, default)
+        cache_key = (key, default)
+        text = self._ui_text_cache.get(cache_key)
+        if text is None:
+            text = self._ui_text_cache[cache_key] = self.config.get_ui_text(key, default)
+        return text
     
     @pyqtSlot(result=list)
     def getAvailableEngines(self) -> list:
         """Kullanılabilir çeviri motorlarını döndür."""
+        show_debug = bool(getattr(self.config.translation_settings, 'show_debug_engines', False))
+        cache_key = ("engines", show_debug)
+        cached = self._ui_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         engines = [
             {"code": "google", "name": self.config.get_ui_text("translation_engines.google", "🌐 Google Translate (Free)")},
             {"code": "deepl", "name": self.config.get_ui_text("translation_engines.deepl", "🔷 DeepL (API Key)")},
@@ -250,26 +343,30 @@ class AppBackend(QObject):
         ]
         
         # Pseudo motorunu debug modunda göster
-        if getattr(self.config.translation_settings, 'show_debug_engines', False):
+        if show_debug:
              engines.append({"code": "pseudo", "name": self.config.get_ui_text("pseudo_engine_name", "🧪 Pseudo-Localization")})
         
+        self._ui_list_cache[cache_key] = engines
         return engines
     
     @pyqtSlot(result=list)
     def getSourceLanguages(self) -> list:
         """Kaynak dilleri döndür."""
-        languages = [{"code": "auto", "name": self.config.get_ui_text("auto_detect", "🔍 Auto Detect")}]
-        for code, name in self.config.get_target_languages_for_ui():
-            languages.append({"code": code, "name": name})
-        return languages
+        cached = self._ui_list_cache.get("source_languages")
+        if cached is None:
+            cached = [{"code": "auto", "name": self.config.get_ui_text("auto_detect", "🔍 Auto Detect")}]
+            cached.extend(self.getTargetLanguages())
+            self._ui_list_cache["source_languages"] = cached
+        return cached
     
     @pyqtSlot(result=list)
     def getTargetLanguages(self) -> list:
         """Hedef dilleri döndür."""
-        languages = []
-        for code, name in self.config.get_target_languages_for_ui():
-            languages.append({"code": code, "name": name})
-        return languages
+        cached = self._ui_list_cache.get("target_languages")
+        if cached is None:
+            cached = [{"code": code, "name": name} for code, name in self.config.get_target_languages_for_ui()]
+            self._ui_list_cache["target_languages"] = cached
+        return cached
     
     @pyqtSlot(str)
     def openUrl(self, url: str):
@@ -476,12 +573,17 @@ class AppBackend(QObject):
     @pyqtSlot(result=list)
     def getGoogleFontsList(self) -> list:
         """Kullanılabilir Google fontlarını döndür."""
+        cached = self._ui_list_cache.get("google_fonts")
+        if cached is not None:
+            return cached
         try:
             from src.utils.font_injector import FontInjector
             injector = FontInjector()
-            return injector.get_available_fonts()
+            fonts = injector.get_available_fonts()
         except Exception:
             return ["Roboto", "Noto Sans", "Open Sans"] # Fallback
+        self._ui_list_cache["google_fonts"] = fonts
+        return fonts
 
     def _run_font_inject_thread(self, lang, force_font=None):
         try:
@@ -569,7 +671,7 @@ class AppBackend(QObject):
         
         self.config.app_settings.last_input_directory = path
         self._project_path = path  # Update internal state
-        self.config.save_config()
+        self._schedule_save()
         self.logMessage.emit("info", self.config.get_log_text("log_project_path_set", path=path))
 
         # Validate
@@ -590,7 +692,7 @@ class AppBackend(QObject):
         changed = self._selected_engine != engine
         self._selected_engine = engine
         self.config.translation_settings.selected_engine = engine
-        self.config.save_config()
+        self._schedule_save()
         if changed:
             self.engineChanged.emit()
         self.logMessage.emit("info", self.config.get_log_text("log_engine_selected", engine=engine))
@@ -651,14 +753,14 @@ class AppBackend(QObject):
         """Kaynak dili ayarla."""
         self._source_language = lang
         self.config.translation_settings.source_language = lang
-        self.config.save_config()
+        self._schedule_save()
     
     @pyqtSlot(str)
     def setTargetLanguage(self, lang: str):
         """Hedef dili ayarla."""
         self._target_language = lang
         self.config.translation_settings.target_language = lang
-        self.config.save_config()
+        self._schedule_save()
         # Reload cache for the new language (Async to avoid UI freeze)
         self._update_cache_path_async()
 
@@ -702,7 +804,7 @@ class AppBackend(QObject):
                 # self.logMessage.emit("debug", f"Cache reloaded from: {cache_file}") # Too verbose?
             else:
                 # Clear cache if file doesn't exist for this new context, to avoid showing old project data
-                self.translation_manager._cache.clear()
+                self.translation_manager.clear_cache()
                 self.translation_manager.cache_hits = 0
                 self.translation_manager.cache_misses = 0
                 
@@ -990,6 +1092,7 @@ class AppBackend(QObject):
         from src.core.ai_translator import OpenAITranslator, GeminiTranslator, LocalLLMTranslator
 
         ts = self.config.translation_settings
+        keys = self.config.api_keys
         self.translation_manager.max_retries = ts.max_retries
         self.translation_manager.max_batch_size = ts.max_batch_size
         self.translation_manager.set_max_concurrency(ts.max_concurrent_threads)
@@ -1000,13 +1103,13 @@ class AppBackend(QObject):
         # self.translation_manager.add_translator(...) # Already added in init
         
         if engine == TranslationEngine.OPENAI:
-            if not self.config.api_keys.openai_api_key:
+            if not keys.openai_api_key:
                 raise ValueError(self.config.get_ui_text("error_api_key_missing", "API Key Missing").format(engine="OpenAI"))
                 
             self.translation_manager.add_translator(
                 TranslationEngine.OPENAI,
                 OpenAITranslator(
-                    api_key=self.config.api_keys.openai_api_key,
+                    api_key=keys.openai_api_key,
                     model=ts.openai_model or "gpt-3.5-turbo",
                     base_url=ts.openai_base_url,
                     proxy_manager=self.proxy_manager if use_proxy else None,
@@ -1030,11 +1133,11 @@ class AppBackend(QObject):
                 )
             )
         elif engine == TranslationEngine.GEMINI:
-            if not self.config.api_keys.gemini_api_key:
+            if not keys.gemini_api_key:
                 raise ValueError(self.config.get_ui_text("error_api_key_missing", "API Key Missing").format(engine="Gemini"))
 
             gemini_translator = GeminiTranslator(
-                api_key=self.config.api_keys.gemini_api_key,
+                api_key=keys.gemini_api_key,
                 model=ts.gemini_model or "gemini-pro",
                 safety_level=ts.gemini_safety_settings,
                 proxy_manager=self.proxy_manager if use_proxy else None,
@@ -1051,7 +1154,7 @@ class AppBackend(QObject):
             self.translation_manager.add_translator(
                 TranslationEngine.DEEPL,
                 DeepLTranslator(
-                    api_key=self.config.api_keys.deepl_api_key,
+                    api_key=keys.deepl_api_key,
                     proxy_manager=self.proxy_manager,
                     config_manager=self.config
                 )
@@ -1081,32 +1184,60 @@ class AppBackend(QObject):
             return
 
         self.logMessage.emit("info", self.config.get_ui_text("update_checking", "Checking for updates..."))
-        threading.Thread(target=self._check_updates_thread, args=(manual,), daemon=True).start()
+        self._ensure_update_worker()
+        self._updateCheckRequested.emit(manual)
+
+    def _config_dir(self) -> Optional[str]:
+        """config.json'un bulunduğu klasör; ConfigManager dosya yolunu vermiyorsa uygulama klasörü kullanılır."""
+        config_file = getattr(self.config, 'config_file', None)
+        if config_file:
+            return os.path.dirname(os.path.abspath(str(config_file)))
+        return None
+
+    def _ensure_update_worker(self):
+        """Update worker'ını ve kalıcı thread'ini ilk ihtiyaçta bir kez kur."""
+        if self._update_thread is not None:
+            return
+        self._update_thread = QThread(self)
+        self._update_worker = UpdateCheckWorker(self._version, self._config_dir())
+        self._update_worker.moveToThread(self._update_thread)
+        self._updateCheckRequested.connect(self._update_worker.check)
+        self._update_worker.finished.connect(self._on_update_check_finished)
+        self._update_thread.finished.connect(self._update_worker.deleteLater)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._stop_update_thread)
+        self._update_thread.start()
 
-    def _check_updates_thread(self, manual: bool):
-        try:
-            from src.utils.update_checker import check_for_updates
-            result = check_for_updates(self._version)
-            
-            if result.update_available:
-                self.logMessage.emit("success", self.config.get_log_text("log_update_available", version=result.latest_version))
-                # Emit update signal: current, latest, url
-                self.updateAvailable.emit(
-                    result.current_version,
-                    result.latest_version,
-                    result.release_url
-                )
-                if manual:
-                     self.updateCheckFinished.emit(True, f"Update found: {result.latest_version}")
-            else:
-                msg = self.config.get_ui_text("update_check_no_update", "You are up to date.")
-                if manual:
-                     self.logMessage.emit("success", msg)
-                     self.updateCheckFinished.emit(False, msg)
-        except Exception as e:
+    @pyqtSlot()
+    def _stop_update_thread(self):
+        if self._update_thread is not None:
+            self._update_thread.quit()
+            self._update_thread.wait(2000)
+
+    @pyqtSlot(object, str, bool)
+    def _on_update_check_finished(self, result, error: str, manual: bool):
+        if error:
             if manual:
-                self.logMessage.emit("error", self.config.get_ui_text("log_update_check_failed", "Update check failed: {error}").replace("{error}", str(e)))
-                self.updateCheckFinished.emit(False, f"Update Check Failed: {e}")
+                self.logMessage.emit("error", self.config.get_ui_text("log_update_check_failed", "Update check failed: {error}").replace("{error}", error))
+                self.updateCheckFinished.emit(False, f"Update Check Failed: {error}")
+            return
+
+        if result.update_available:
+            self.logMessage.emit("success", self.config.get_log_text("log_update_available", version=result.latest_version))
+            # Emit update signal: current, latest, url
+            self.updateAvailable.emit(
+                result.current_version,
+                result.latest_version,
+                result.release_url
+            )
+            if manual:
+                 self.updateCheckFinished.emit(True, f"Update found: {result.latest_version}")
+        else:
+            msg = self.config.get_ui_text("update_check_no_update", "You are up to date.")
+            if manual:
+                 self.logMessage.emit("success", msg)
+                 self.updateCheckFinished.emit(False, msg)
 
     # ========== HELPERS ==========
 
@@ -1117,30 +1248,29 @@ class AppBackend(QObject):
 
     # ========== PIPELINE SIGNAL HANDLERS ==========
     
+    @pyqtSlot(str, str)
     def _on_stage_changed(self, stage: str, message: str):
         """Handle pipeline stage change."""
-        stage_keys = {
-            "idle": "stage_idle", "validating": "stage_validating",
-            "unren": "stage_unren", "generating": "stage_generating",
-            "parsing": "stage_parsing", "translating": "stage_translating",
-            "saving": "stage_saving", "completed": "stage_completed",
-            "error": "stage_error"
-        }
-        display_name = self.config.get_ui_text(stage_keys.get(stage, "stage_idle"), stage)
+        # Aşama adları dil başına önbellekten gelir (refreshUI ile temizlenir)
+        display_name = self.getTextWithDefault(self._STAGE_TEXT_KEYS.get(stage, "stage_idle"), stage)
         self.stageChanged.emit(stage, display_name)
     
+    @pyqtSlot(int, int, str)
     def _on_progress_updated(self, current: int, total: int, text: str):
         """Handle translation progress update."""
         self.progressChanged.emit(current, total, text)
     
+    @pyqtSlot(str, str)
     def _on_log_message(self, level: str, message: str):
         """Handle log message from pipeline."""
         self.logMessage.emit(level, message)
     
+    @pyqtSlot(str, str)
     def _on_show_warning(self, title: str, message: str):
         """Show warning popup from pipeline."""
         self.warningMessage.emit(title, message)
     
+    @pyqtSlot(object)
     def _on_pipeline_finished(self, result):
         """Handle pipeline completion."""
         self._is_translating = False
@@ -1261,6 +1391,7 @@ class AppBackend(QObject):
             
             count = 0
             limit = 1000 # Hard limit for UI performance for now
+            append = entries.append  # Döngü içinde attribute lookup yapılmasın
             
             for key, val in cache_snapshot:
                 engine, sl, tl, original = key
@@ -1272,7 +1403,7 @@ class AppBackend(QObject):
                         filter_text not in engine.lower()):
                         continue
                         
-                entries.append({
+                append({
                     "engine": engine,
                     "source_lang": sl,
                     "target_lang": tl,
@@ -1315,9 +1446,7 @@ class AppBackend(QObject):
     def deleteCacheEntry(self, engine: str, source_lang: str, target_lang: str, original: str) -> bool:
         """Delete a specific cache entry."""
         key = (engine, source_lang, target_lang, original)
-        if key in self.translation_manager._cache:
-            del self.translation_manager._cache[key]
-            
+        if self.translation_manager.delete_cache_entry(key):
             cache_file = self._get_current_cache_file()
             if cache_file:
                 self.translation_manager.save_cache(cache_file)
@@ -1328,11 +1457,7 @@ class AppBackend(QObject):
     def updateCacheEntry(self, engine: str, source_lang: str, target_lang: str, original: str, new_translation: str) -> bool:
         """Update a specific cache entry."""
         key = (engine, source_lang, target_lang, original)
-        if key in self.translation_manager._cache:
-            # Update the translated text
-            res = self.translation_manager._cache[key]
-            res.translated_text = new_translation
-            
+        if self.translation_manager.update_cache_entry(key, new_translation):
             cache_file = self._get_current_cache_file()
             if cache_file:
                 self.translation_manager.save_cache(cache_file)
@@ -1343,7 +1468,7 @@ class AppBackend(QObject):
     def clearCache(self) -> bool:
         """Clear all cache."""
         try:
-            self.translation_manager._cache.clear()
+            self.translation_manager.clear_cache()
             
             cache_file = self._get_current_cache_file()
             if cache_file and os.path.exists(os.path.dirname(cache_file)):
@@ -6,7 +6,7 @@ Settings Backend - Python-QML Bridge for Settings
 Provides settings management functionality for QML UI.
 """
 
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, pyqtProperty, QTimer
 from PyQt6.QtWidgets import QApplication
 
 from src.utils.config import ConfigManager, Language
@@ -15,6 +15,34 @@ from src.utils.config import ConfigManager, Language
 class SettingsBackend(QObject):
     """Settings page Python-QML bridge."""
     
+    # Arayüz dilleri sabittir (isimler kendi dillerinde); ComboBox modeli her açılışta yeniden kurulmaz
+    UI_LANGUAGES = [
+        {"code": "tr", "name": "🇹🇷 Türkçe"},
+        {"code": "en", "name": "🇬🇧 English"},
+        {"code": "de", "name": "🇩🇪 Deutsch"},
+        {"code": "fr", "name": "🇫🇷 Français"},
+        {"code": "es", "name": "🇪🇸 Español"},
+        {"code": "ru", "name": "🇷🇺 Русский"},
+        {"code": "fa", "name": "🇮🇷 فارسی"},
+        {"code": "zh-CN", "name": "🇨🇳 中文 (简体)"},
+        {"code": "ja", "name": "🇯🇵 日本語"},
+    ]
+    UI_LANGUAGE_INDEX = {lang["code"]: i for i, lang in enumerate(UI_LANGUAGES)}
+    
+    # Temalar: (kod, çeviri anahtarı, varsayılan etiket); sıra ComboBox sırasıdır
+    THEMES = (
+        ("dark", "theme_dark", "🌙 Dark"),
+        ("light", "theme_light", "☀️ Light"),
+        ("red", "theme_red", "🔴 Red"),
+        ("turquoise", "theme_turquoise", "🔵 Turquoise"),
+        ("green", "theme_green", "🌿 Green"),
+        ("neon", "theme_neon", "🌈 Neon"),
+    )
+    THEME_INDEX = {code: i for i, (code, _, _) in enumerate(THEMES)}
+    
+    # Ayar değişikliklerinden sonra diske yazmadan önce beklenecek süre (ms)
+    SAVE_DEBOUNCE_MS = 400
+    
     # Signals
     settingsSaved = pyqtSignal()
     languageChanged = pyqtSignal(str)
@@ -26,28 +54,62 @@ class SettingsBackend(QObject):
         super().__init__(parent)
         self.config = config_manager
         self._proxy_manager = proxy_manager  # Reference to app's real ProxyManager
+        # (key, default) -> text; cleared when the UI language changes
+        self._ui_text_cache = {}
+        
+        # Setter'lar her tuş/adımda diske yazmasın: arka arkaya gelen değişiklikler tek yazıma toplanır
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self.config.save_config)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_save)
+    
+    def _update_setting(self, section, name: str, value) -> bool:
+        """Assign a config field; schedule a save only if the value actually changed."""
+        if getattr(section, name, None) == value:
+            return False
+        setattr(section, name, value)
+        self._schedule_save()
+        return True
+    
+    def _schedule_save(self):
+        """Restart the debounce timer; config is written once the edits settle."""
+        self._save_timer.start()
+    
+    def _save_now(self):
+        """Write config immediately (explicit actions); cancels any pending debounced save."""
+        self._save_timer.stop()
+        self.config.save_config()
+
+    @pyqtSlot()
+    def _flush_save(self):
+        """Write pending config changes now (application exit)."""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.config.save_config()
     
     @pyqtSlot(str, str, result=str)
     def getTextWithDefault(self, key: str, default: str) -> str:
         """Get localized text with default fallback."""
-        return self.config.get_ui_text(key, default)
+        cache_key = (key, default)
+        text = self._ui_text_cache.get(cache_key)
+        if text is None:
+            text = self._ui_text_cache[cache_key] = self.config.get_ui_text(key, default)
+        return text
     
     # ==================== GENERAL SETTINGS ====================
     
     @pyqtSlot(result=list)
     def getAvailableUILanguages(self) -> list:
         """Get available UI languages."""
-        return [
-            {"code": "tr", "name": "🇹🇷 Türkçe"},
-            {"code": "en", "name": "🇬🇧 English"},
-            {"code": "de", "name": "🇩🇪 Deutsch"},
-            {"code": "fr", "name": "🇫🇷 Français"},
-            {"code": "es", "name": "🇪🇸 Español"},
-            {"code": "ru", "name": "🇷🇺 Русский"},
-            {"code": "fa", "name": "🇮🇷 فارسی"},
-            {"code": "zh-CN", "name": "🇨🇳 中文 (简体)"},
-            {"code": "ja", "name": "🇯🇵 日本語"},
-        ]
+        return self.UI_LANGUAGES
+    
+    @pyqtSlot(str, result=int)
+    def getUILanguageIndex(self, code: str) -> int:
+        """Index of a UI language code in getAvailableUILanguages() (0 if unknown)."""
+        return self.UI_LANGUAGE_INDEX.get(code, 0)
     
     @pyqtSlot(result=str)
     def getCurrentUILanguage(self) -> str:
@@ -61,7 +123,8 @@ class SettingsBackend(QObject):
             lang = Language(lang_code)
             # self.config.app_settings.ui_language = lang_code # Handled inside load_locale
             self.config.load_locale(lang)
-            self.config.save_config()
+            self._ui_text_cache.clear()
+            self._save_now()
             self.languageChanged.emit(lang_code)
         except Exception as e:
             print(f"Error setting UI language: {e}")
@@ -69,14 +132,13 @@ class SettingsBackend(QObject):
     @pyqtSlot(result=list)
     def getAvailableThemes(self) -> list:
         """Get available themes - internal only, no system theme."""
-        return [
-            {"code": "dark", "name": self.config.get_ui_text("theme_dark", "🌙 Dark")},
-            {"code": "light", "name": self.config.get_ui_text("theme_light", "☀️ Light")},
-            {"code": "red", "name": self.config.get_ui_text("theme_red", "🔴 Red")},
-            {"code": "turquoise", "name": self.config.get_ui_text("theme_turquoise", "🔵 Turquoise")},
-            {"code": "green", "name": self.config.get_ui_text("theme_green", "🌿 Green")},
-            {"code": "neon", "name": self.config.get_ui_text("theme_neon", "🌈 Neon")},
-        ]
+        # Etiketler dil başına önbelleğe alınan getTextWithDefault üzerinden çözülür
+        return [{"code": code, "name": self.getTextWithDefault(key, default)} for code, key, default in self.THEMES]
+    
+    @pyqtSlot(str, result=int)
+    def getThemeIndex(self, code: str) -> int:
+        """Index of a theme code in getAvailableThemes() (0 if unknown)."""
+        return self.THEME_INDEX.get(code, 0)
     
     @pyqtProperty(str, notify=themeChanged)
     def currentTheme(self):
@@ -111,8 +173,7 @@ class SettingsBackend(QObject):
     @pyqtSlot(str)
     def setTheme(self, theme: str):
         """Set application theme."""
-        self.config.app_settings.app_theme = theme
-        self.config.save_config()
+        self._update_setting(self.config.app_settings, "app_theme", theme)
         
         # Theme remains applied via QML Material configuration
         pass
@@ -127,8 +188,7 @@ class SettingsBackend(QObject):
     @pyqtSlot(bool)
     def setCheckUpdates(self, enabled: bool):
         """Set check updates setting."""
-        self.config.app_settings.check_for_updates = enabled
-        self.config.save_config()
+        self._update_setting(self.config.app_settings, "check_for_updates", enabled)
     
     # ==================== API KEYS ====================
     
@@ -138,8 +198,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setDeepLApiKey(self, key: str):
-        self.config.api_keys.deepl_api_key = key
-        self.config.save_config()
+        self._update_setting(self.config.api_keys, "deepl_api_key", key)
 
     @pyqtSlot(result=str)
     def getDeepLFormality(self) -> str:
@@ -147,8 +206,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(str)
     def setDeepLFormality(self, value: str):
-        self.config.translation_settings.deepl_formality = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "deepl_formality", value)
     
     @pyqtSlot(result=str)
     def getOpenAIApiKey(self) -> str:
@@ -156,8 +214,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setOpenAIApiKey(self, key: str):
-        self.config.api_keys.openai_api_key = key
-        self.config.save_config()
+        self._update_setting(self.config.api_keys, "openai_api_key", key)
     
     @pyqtSlot(result=str)
     def getGeminiApiKey(self) -> str:
@@ -165,8 +222,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setGeminiApiKey(self, key: str):
-        self.config.api_keys.gemini_api_key = key
-        self.config.save_config()
+        self._update_setting(self.config.api_keys, "gemini_api_key", key)
 
     @pyqtSlot(result=str)
     def getDeepSeekApiKey(self) -> str:
@@ -174,8 +230,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(str)
     def setDeepSeekApiKey(self, key: str):
-        self.config.api_keys.deepseek_api_key = key
-        self.config.save_config()
+        self._update_setting(self.config.api_keys, "deepseek_api_key", key)
 
     @pyqtSlot(result=str)
     def getDeepSeekModel(self) -> str:
@@ -183,8 +238,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(str)
     def setDeepSeekModel(self, value: str):
-        self.config.translation_settings.deepseek_model = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "deepseek_model", value)
     
     # ==================== TRANSLATION SETTINGS ====================
     
@@ -194,8 +248,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setBatchSize(self, value: int):
-        self.config.translation_settings.max_batch_size = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "max_batch_size", value)
     
     @pyqtSlot(result=float)
     def getRequestDelay(self) -> float:
@@ -203,8 +256,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(float)
     def setRequestDelay(self, value: float):
-        self.config.translation_settings.request_delay = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "request_delay", value)
     
     @pyqtSlot(result=int)
     def getConcurrentThreads(self) -> int:
@@ -212,8 +264,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setConcurrentThreads(self, value: int):
-        self.config.translation_settings.max_concurrent_threads = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "max_concurrent_threads", value)
     
     @pyqtSlot(result=int)
     def getContextLimit(self) -> int:
@@ -221,8 +272,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setContextLimit(self, value: int):
-        self.config.translation_settings.context_limit = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "context_limit", value)
     
     @pyqtSlot(result=int)
     def getMaxRetries(self) -> int:
@@ -230,8 +280,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setMaxRetries(self, value: int):
-        self.config.translation_settings.max_retries = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "max_retries", value)
 
     @pyqtSlot(result=int)
     def getTimeout(self) -> int:
@@ -239,8 +288,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setTimeout(self, value: int):
-        self.config.translation_settings.timeout = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "timeout", value)
 
     @pyqtSlot(result=int)
     def getMaxCharsPerRequest(self) -> int:
@@ -248,8 +296,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setMaxCharsPerRequest(self, value: int):
-        self.config.translation_settings.max_chars_per_request = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "max_chars_per_request", value)
 
     @pyqtSlot(result=bool)
     def getAggressiveRetry(self) -> bool:
@@ -257,8 +304,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setAggressiveRetry(self, enabled: bool):
-        self.config.translation_settings.aggressive_retry_translation = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "aggressive_retry_translation", enabled)
 
     @pyqtSlot(result=bool)
     def getForceRuntime(self) -> bool:
@@ -266,8 +312,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setForceRuntime(self, enabled: bool):
-        self.config.translation_settings.force_runtime_translation = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "force_runtime_translation", enabled)
 
     @pyqtSlot(result=bool)
     def getUseMultiEndpoint(self) -> bool:
@@ -275,8 +320,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setUseMultiEndpoint(self, enabled: bool):
-        self.config.translation_settings.use_multi_endpoint = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "use_multi_endpoint", enabled)
 
     @pyqtSlot(result=bool)
     def getEnableLingvaFallback(self) -> bool:
@@ -284,8 +328,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setEnableLingvaFallback(self, enabled: bool):
-        self.config.translation_settings.enable_lingva_fallback = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "enable_lingva_fallback", enabled)
     
     # ==================== AI SETTINGS ====================
     
@@ -295,8 +338,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setOpenAIModel(self, model: str):
-        self.config.translation_settings.openai_model = model
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "openai_model", model)
     
     @pyqtSlot(result=str)
     def getOpenAIBaseUrl(self) -> str:
@@ -304,8 +346,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setOpenAIBaseUrl(self, url: str):
-        self.config.translation_settings.openai_base_url = url
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "openai_base_url", url)
     
     @pyqtSlot(result=str)
     def getGeminiModel(self) -> str:
@@ -313,8 +354,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setGeminiModel(self, model: str):
-        self.config.translation_settings.gemini_model = model
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "gemini_model", model)
     
     @pyqtSlot(result=str)
     def getGeminiSafety(self) -> str:
@@ -322,8 +362,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setGeminiSafety(self, level: str):
-        self.config.translation_settings.gemini_safety_settings = level
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "gemini_safety_settings", level)
     
     @pyqtSlot(result=str)
     def getLocalLLMModel(self) -> str:
@@ -331,8 +370,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setLocalLLMModel(self, text: str):
-        self.config.translation_settings.local_llm_model = text
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "local_llm_model", text)
 
     # ==================== OPENAI PRESETS ====================
     @pyqtSlot(result=list)
@@ -393,8 +431,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setLocalLLMUrl(self, url: str):
-        self.config.translation_settings.local_llm_url = url
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "local_llm_url", url)
 
     @pyqtSlot(result=int)
     def getLocalLLMTimeout(self) -> int:
@@ -402,8 +439,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setLocalLLMTimeout(self, value: int):
-        self.config.translation_settings.local_llm_timeout = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "local_llm_timeout", value)
 
     @pyqtSlot(result=str)
     def testLocalLLMConnection(self) -> str:
@@ -436,8 +472,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(float)
     def setAITemperature(self, value: float):
-        self.config.translation_settings.ai_temperature = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_temperature", value)
     
     @pyqtSlot(result=int)
     def getAITimeout(self) -> int:
@@ -445,8 +480,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(int)
     def setAITimeout(self, value: int):
-        self.config.translation_settings.ai_timeout = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_timeout", value)
 
     @pyqtSlot(result=bool)
     def getUseHtmlProtection(self) -> bool:
@@ -459,7 +493,7 @@ class SettingsBackend(QObject):
             self.config.translation_settings.use_html_protection = False
         else:
             self.config.translation_settings.use_html_protection = value
-        self.config.save_config()
+        self._schedule_save()
 
     @pyqtSlot(result=int)
     def getAIMaxTokens(self) -> int:
@@ -467,8 +501,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(int)
     def setAIMaxTokens(self, value: int):
-        self.config.translation_settings.ai_max_tokens = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_max_tokens", value)
 
     @pyqtSlot(result=int)
     def getAIBatchSize(self) -> int:
@@ -476,8 +509,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(int)
     def setAIBatchSize(self, value: int):
-        self.config.translation_settings.ai_batch_size = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_batch_size", value)
 
     @pyqtSlot(result=int)
     def getAIRetryCount(self) -> int:
@@ -485,8 +517,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(int)
     def setAIRetryCount(self, value: int):
-        self.config.translation_settings.ai_retry_count = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_retry_count", value)
 
     @pyqtSlot(result=int)
     def getAIConcurrency(self) -> int:
@@ -494,8 +525,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(int)
     def setAIConcurrency(self, value: int):
-        self.config.translation_settings.ai_concurrency = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_concurrency", value)
 
     @pyqtSlot(result=float)
     def getAIRequestDelay(self) -> float:
@@ -503,8 +533,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(float)
     def setAIRequestDelay(self, value: float):
-        self.config.translation_settings.ai_request_delay = value
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_request_delay", value)
 
     @pyqtSlot(result=str)
     def getAISystemPrompt(self) -> str:
@@ -512,8 +541,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(str)
     def setAISystemPrompt(self, text: str):
-        self.config.translation_settings.ai_custom_system_prompt = text
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "ai_custom_system_prompt", text)
     
     # ==================== PROXY SETTINGS ====================
     
@@ -523,8 +551,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(bool)
     def setProxyEnabled(self, enabled: bool):
-        self.config.proxy_settings.enabled = enabled
-        self.config.save_config()
+        self._update_setting(self.config.proxy_settings, "enabled", enabled)
         
         # Show warning when enabling free proxy mode (no personal proxy configured)
         if enabled:
@@ -544,8 +571,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(str)
     def setProxyUrl(self, url: str):
-        self.config.proxy_settings.proxy_url = url
-        self.config.save_config()
+        self._update_setting(self.config.proxy_settings, "proxy_url", url)
 
     @pyqtSlot(result=str)
     def getManualProxies(self) -> str:
@@ -555,8 +581,7 @@ class SettingsBackend(QObject):
     @pyqtSlot(str)
     def setManualProxies(self, text: str):
         proxies = [p.strip() for p in text.split("\n") if p.strip()]
-        self.config.proxy_settings.manual_proxies = proxies
-        self.config.save_config()
+        self._update_setting(self.config.proxy_settings, "manual_proxies", proxies)
 
     @pyqtSlot()
     def refreshProxies(self):
@@ -603,8 +628,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(str)
     def setDeepLFormality(self, formality: str):
-        self.config.translation_settings.deepl_formality = formality
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "deepl_formality", formality)
     
     # ==================== ADVANCED SETTINGS ====================
     
@@ -614,8 +638,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(bool)
     def setShowDebugEngines(self, enabled: bool):
-        self.config.translation_settings.show_debug_engines = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "show_debug_engines", enabled)
     
     @pyqtSlot(result=bool)
     def getExcludeSystemFolders(self) -> bool:
@@ -623,8 +646,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(bool)
     def setExcludeSystemFolders(self, enabled: bool):
-        self.config.translation_settings.exclude_system_folders = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "exclude_system_folders", enabled)
     
     @pyqtSlot(result=bool)
     def getScanRpymFiles(self) -> bool:
@@ -632,8 +654,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(bool)
     def setScanRpymFiles(self, enabled: bool):
-        self.config.translation_settings.scan_rpym_files = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "scan_rpym_files", enabled)
     
     @pyqtSlot(result=bool)
     def getUseGlobalCache(self) -> bool:
@@ -641,8 +662,7 @@ class SettingsBackend(QObject):
     
     @pyqtSlot(bool)
     def setUseGlobalCache(self, enabled: bool):
-        self.config.translation_settings.use_global_cache = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "use_global_cache", enabled)
 
     @pyqtSlot(result=bool)
     def getEnableDeepScan(self) -> bool:
@@ -650,8 +670,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setEnableDeepScan(self, enabled: bool):
-        self.config.translation_settings.enable_deep_scan = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "enable_deep_scan", enabled)
 
     # DEPRECATED: Fuzzy match no longer used in v2.5.1+ (XRPYX format)
     # Kept for backward compatibility with old config files
@@ -671,8 +690,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setEnableRpycReader(self, enabled: bool):
-        self.config.translation_settings.enable_rpyc_reader = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "enable_rpyc_reader", enabled)
 
     @pyqtSlot(result=bool)
     def getAutoUnren(self) -> bool:
@@ -680,8 +698,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setAutoUnren(self, enabled: bool):
-        self.config.app_settings.unren_auto_download = enabled
-        self.config.save_config()
+        self._update_setting(self.config.app_settings, "unren_auto_download", enabled)
 
     @pyqtSlot(result=bool)
     def getAutoHook(self) -> bool:
@@ -689,8 +706,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setAutoHook(self, enabled: bool):
-        self.config.translation_settings.auto_generate_hook = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "auto_generate_hook", enabled)
 
     @pyqtSlot(result=bool)
     def getUseCache(self) -> bool:
@@ -698,8 +714,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setUseCache(self, enabled: bool):
-        self.config.translation_settings.use_cache = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "use_cache", enabled)
 
     # ==================== v2.7.1 NEW SETTINGS ====================
 
@@ -709,8 +724,7 @@ class SettingsBackend(QObject):
 
     @pyqtSlot(bool)
     def setAutoProtectCharNames(self, enabled: bool):
-        self.config.translation_settings.auto_protect_character_names = enabled
-        self.config.save_config()
+        self._update_setting(self.config.translation_settings, "auto_protect_character_names", enabled)
 
     @pyqtSlot(result=str)
     def getCustomFunctionParams(self) -> str:
@@ -721,8 +735,7 @@ class SettingsBackend(QObject):
         import json
         try:
             json.loads(text)  # Validate JSON
-            self.config.translation_settings.custom_function_params = text
-            self.config.save_config()
+            self._update_setting(self.config.translation_settings, "custom_function_params", text)
         except (json.JSONDecodeError, TypeError):
             pass  # Invalid JSON — ignore silently
 
@@ -741,11 +754,11 @@ class SettingsBackend(QObject):
         if key == "fuzzy_match":
             return
         setattr(self.config.translation_settings, f"translate_{key}", value)
-        self.config.save_config()
+        self._schedule_save()
     
     @pyqtSlot()
     def restoreDefaults(self):
         """Restore all settings to defaults."""
         self.config.reset_to_defaults()
-        self.config.save_config()
+        self._save_now()
         self.settingsSaved.emit()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
 import logging
 import json
 import os
@@ -92,6 +93,8 @@ CRITICAL RULES:
         self.max_retries = max_retries
         # Fallback engine (usually Google Web) if AI refuses content
         self.fallback_translator: Optional[BaseTranslator] = None
+        # (source_lang, target_lang, custom_prompt, ui_language) -> base system prompt
+        self._system_prompt_cache: Dict[tuple, str] = {}
 
     def _get_text(self, key: str, default: str, **kwargs) -> str:
         """Helper to get localized text from config_manager."""
@@ -99,6 +102,28 @@ CRITICAL RULES:
             return self.config_manager.get_ui_text(key, default).format(**kwargs)
         return default.format(**kwargs)
 
+    def _get_base_system_prompt(self, source_lang: str, target_lang: str) -> str:
+        """Returns the system prompt for a language pair (custom or localized default), memoized per pair."""
+        custom_prompt = ""
+        ui_language = ""
+        if self.config_manager:
+            custom_prompt = getattr(self.config_manager.translation_settings, 'ai_custom_system_prompt', '').strip()
+            ui_language = getattr(getattr(self.config_manager, 'app_settings', None), 'ui_language', '') or ''
+
+        key = (source_lang, target_lang, custom_prompt, ui_language)
+        prompt = self._system_prompt_cache.get(key)
+        if prompt is None:
+            if custom_prompt:
+                # User-defined prompt with variable substitution
+                prompt = custom_prompt.replace('{source_lang}', source_lang).replace('{target_lang}', target_lang)
+            else:
+                # Default localized prompt
+                prompt = self._get_text('ai_system_prompt', self.SYSTEM_PROMPT_TEMPLATE,
+                                        source_lang=source_lang,
+                                        target_lang=target_lang)
+            self._system_prompt_cache[key] = prompt
+        return prompt
+
     def set_fallback_translator(self, translator: BaseTranslator):
         """Sets a fallback translator for safety filter violations."""
         self.fallback_translator = translator
@@ -169,19 +194,8 @@ IMPORTANT:
         if self.config_manager:
             aggressive_retry = getattr(self.config_manager.translation_settings, 'aggressive_retry_translation', False)
         
-        # Check if user has defined a custom system prompt
-        custom_prompt = ""
-        if self.config_manager:
-            custom_prompt = getattr(self.config_manager.translation_settings, 'ai_custom_system_prompt', '').strip()
-        
-        if custom_prompt:
-            # User-defined prompt with variable substitution
-            system_prompt = custom_prompt.replace('{source_lang}', request.source_lang).replace('{target_lang}', request.target_lang)
-        else:
-            # Default localized prompt
-            system_prompt = self._get_text('ai_system_prompt', self.SYSTEM_PROMPT_TEMPLATE,
-                                         source_lang=request.source_lang,
-                                         target_lang=request.target_lang)
+        # Custom or default system prompt (memoized per language pair)
+        system_prompt = self._get_base_system_prompt(request.source_lang, request.target_lang)
         
         # Append Glossary instructions if available
         glossary_part = self._get_glossary_prompt_part()
@@ -356,16 +370,7 @@ IMPORTANT:
         
         # System prompt with batching instructions
         req0 = requests[0]
-        custom_prompt = ""
-        if self.config_manager:
-            custom_prompt = getattr(self.config_manager.translation_settings, 'ai_custom_system_prompt', '').strip()
-        
-        if custom_prompt:
-            base_system = custom_prompt.replace('{source_lang}', req0.source_lang).replace('{target_lang}', req0.target_lang)
-        else:
-            base_system = self._get_text('ai_system_prompt', self.SYSTEM_PROMPT_TEMPLATE,
-                                         source_lang=req0.source_lang,
-                                         target_lang=req0.target_lang)
+        base_system = self._get_base_system_prompt(req0.source_lang, req0.target_lang)
                                          
         batch_instruction = self.BATCH_INSTRUCTION_TEMPLATE.format(count=len(unique_requests))
         system_prompt = base_system + batch_instruction
@@ -523,17 +528,22 @@ class OpenAITranslator(LLMTranslator):
                  max_tokens=AI_DEFAULT_MAX_TOKENS, **kwargs):
         super().__init__(api_key, model, temperature=temperature, timeout=timeout, max_tokens=max_tokens, **kwargs)
         
-        try:
-            from openai import AsyncOpenAI
-        except ImportError:
+        # Sadece varlık kontrolü; openai paketi ilk istekte import edilir (açılış süresi)
+        if importlib.util.find_spec("openai") is None:
             raise ImportError("openai library is not installed. Please install it via pip.")
             
-        self.client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=base_url  # Can be OpenRouter or local Ollama URL
-        )
+        self.base_url = base_url  # Can be OpenRouter or local Ollama URL
+        self._client: Optional[AsyncOpenAI] = None
         self.is_openrouter = base_url and "openrouter" in base_url
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """AsyncOpenAI client, created on first use."""
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._client
+
     async def _generate_completion(self, system_prompt: str, user_prompt: str) -> str:
         # OpenRouter expects identification headers for usage ranking.
         extra_headers = self.OPENROUTER_HEADERS if self.is_openrouter else None
@@ -588,7 +598,8 @@ class OpenAITranslator(LLMTranslator):
             raise e
 
     async def close(self):
-        await self.client.close()
+        if self._client is not None:
+            await self._client.close()
         await super().close()
 
 
@@ -603,6 +614,7 @@ class LocalLLMTranslator(LLMTranslator):
     # Optimized prompt for local LLMs (Ollama, LM Studio)
     # Smaller models get confused by long rules; keep it very direct
     LOCAL_SYSTEM_PROMPT = """Translate from {source_lang} to {target_lang}. Preserve Ren'Py [vars] and {{tags}}. Return ONLY the translated text."""
+    max_parallel_singles = 1  # Tek GPU/CPU'lu yerel sunucular eşzamanlı isteklerde yavaşlar veya düşer
     
     def __init__(self, model: str = "llama3.2", base_url: str = "http://localhost:11434/v1",
                  api_key: str = "local", temperature=AI_DEFAULT_TEMPERATURE,
@@ -689,14 +701,16 @@ class LocalLLMTranslator(LLMTranslator):
 
 {text}"""
 
+    # Language code -> full name (built once; _get_lang_name is called per request)
+    LANG_NAMES = {
+        'tr': 'Turkish', 'en': 'English', 'de': 'German', 'fr': 'French',
+        'es': 'Spanish', 'ru': 'Russian', 'it': 'Italian', 'zh': 'Chinese',
+        'pt': 'Portuguese', 'ja': 'Japanese', 'ko': 'Korean', 'auto': 'Source Language'
+    }
+
     def _get_lang_name(self, code: str) -> str:
         """Convert language codes to full names for better LLM understanding."""
-        names = {
-            'tr': 'Turkish', 'en': 'English', 'de': 'German', 'fr': 'French',
-            'es': 'Spanish', 'ru': 'Russian', 'it': 'Italian', 'zh': 'Chinese',
-            'pt': 'Portuguese', 'ja': 'Japanese', 'ko': 'Korean', 'auto': 'Source Language'
-        }
-        return names.get(code.lower(), code)
+        return self.LANG_NAMES.get(code.lower(), code)
 
     async def translate_single(self, request: TranslationRequest) -> TranslationResult:
         """Single translation with full language names and zero-wrapper prompt."""
@@ -756,11 +770,8 @@ class LocalLLMTranslator(LLMTranslator):
 
     async def translate_batch(self, requests: List[TranslationRequest]) -> List[TranslationResult]:
         """Local LLMs often fail with XML-style batching. Process one-by-one instead."""
-        results = []
-        for req in requests:
-            res = await self.translate_single(req)
-            results.append(res)
-        return results
+        # max_parallel_singles = 1: varsayılan yol istekleri sırayla çalıştırır
+        return await BaseTranslator.translate_batch(self, requests)
 
 
 class GeminiTranslator(LLMTranslator):
@@ -771,17 +782,43 @@ class GeminiTranslator(LLMTranslator):
                  max_tokens=AI_DEFAULT_MAX_TOKENS, **kwargs):
         super().__init__(api_key, model, temperature=temperature, timeout=timeout, max_tokens=max_tokens, **kwargs)
         
+        # Sadece varlık kontrolü; google-genai ilk istekte import edilir (açılış süresi)
         try:
-            from google import genai
-            from google.genai import types
-            self.genai = genai
-            self.types = types
-        except ImportError:
+            genai_missing = importlib.util.find_spec("google.genai") is None
+        except ModuleNotFoundError:  # 'google' namespace'i hiç yoksa
+            genai_missing = True
+        if genai_missing:
             raise ImportError("google-genai library is not installed.")
         
-        self.client = self.genai.Client(api_key=api_key)
+        self._genai = None
+        self._client = None
         self.safety_level = safety_level
 
+    def _load_sdk(self):
+        from google import genai
+        from google.genai import types
+        self._genai = genai
+        self._types = types
+
+    @property
+    def genai(self):
+        if self._genai is None:
+            self._load_sdk()
+        return self._genai
+
+    @property
+    def types(self):
+        if self._genai is None:
+            self._load_sdk()
+        return self._types
+
+    @property
+    def client(self):
+        """genai.Client, created on first use."""
+        if self._client is None:
+            self._client = self.genai.Client(api_key=self.api_key)
+        return self._client
+
     def _get_safety_settings(self) -> List[types.SafetySetting]:
         # Default to BLOCK_NONE for all categories if user requested no blocking
         level = "BLOCK_NONE"
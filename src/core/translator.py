@@ -7,8 +7,11 @@ import aiohttp
 import logging
 import os
 import re
+import sys
+import threading
 import time
 import urllib.parse
+import dataclasses
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Tuple, Callable
@@ -16,6 +19,13 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict, deque, Counter
 import random
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional speedup; stdlib json also accepts bytes
+    import json
+    _json_loads = json.loads
+
 from .syntax_guard import (
     protect_renpy_syntax,
     restore_renpy_syntax,
@@ -44,7 +54,7 @@ class TranslationEngine(Enum):
     PSEUDO = "pseudo"  # Pseudo-localization for UI testing
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationRequest:
     text: str
     source_lang: str
@@ -53,7 +63,7 @@ class TranslationRequest:
     metadata: Dict = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     original_text: str
     translated_text: str
@@ -68,70 +78,248 @@ class TranslationResult:
     text_type: Optional[str] = None  # Type of text: 'paragraph', 'dialogue', etc.
 
 
+# ---------------------------------------------------------------------------
+# Process-wide aiohttp session registry
+# ---------------------------------------------------------------------------
+# All translators share one pooled ClientSession per (event loop, timeout) so
+# TCP/TLS connections to the same hosts are reused across engines and jobs.
+# aiohttp sessions are bound to the loop that created them; pipelines create a
+# fresh loop per job, so the running loop is part of the key.
+# Value: [session, refcount]
+_SESSION_REGISTRY: Dict[tuple, list] = {}
+_SESSION_REGISTRY_LOCK = threading.Lock()
+_SESSION_TIMEOUT = aiohttp.ClientTimeout(total=45, connect=10, sock_read=30)
+
+
+def _acquire_shared_session(loop: asyncio.AbstractEventLoop, timeout: aiohttp.ClientTimeout) -> Tuple[tuple, aiohttp.ClientSession]:
+    """Return (key, session) from the registry, creating the session if needed."""
+    key = (loop, timeout.total, timeout.connect, timeout.sock_read)
+    with _SESSION_REGISTRY_LOCK:
+        entry = _SESSION_REGISTRY.get(key)
+        if entry is None or entry[0].closed:
+            connector = aiohttp.TCPConnector(
+                limit=256,
+                limit_per_host=64,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                force_close=False,
+                enable_cleanup_closed=True
+            )
+            headers = {'Connection': 'keep-alive'}
+            if USER_AGENTS:
+                headers['User-Agent'] = random.choice(USER_AGENTS)
+            session = aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers)
+            entry = [session, 0]
+            _SESSION_REGISTRY[key] = entry
+        entry[1] += 1
+        return key, entry[0]
+
+
+def _release_shared_session(key: tuple) -> Optional[aiohttp.ClientSession]:
+    """Decrement the refcount for key; return the session if it should now be closed."""
+    with _SESSION_REGISTRY_LOCK:
+        entry = _SESSION_REGISTRY.get(key)
+        if entry is None:
+            return None
+        entry[1] -= 1
+        if entry[1] > 0:
+            return None
+        del _SESSION_REGISTRY[key]
+        return entry[0]
+
+
+def _pop_stale_sessions() -> List[aiohttp.ClientSession]:
+    """Remove entries whose loop has been closed (their sessions are unusable) and return the sessions."""
+    with _SESSION_REGISTRY_LOCK:
+        stale = [k for k in _SESSION_REGISTRY if k[0].is_closed()]
+        return [_SESSION_REGISTRY.pop(k)[0] for k in stale]
+
+
+async def _close_sessions(sessions: List[aiohttp.ClientSession]):
+    # Kapanmış loop'a ait oturum başka bir loop'tan kapatılabilir: bağlantılar zaten ölü,
+    # close() yalnızca connector'ı bırakır ve "Unclosed client session" uyarısını önler
+    for session in sessions:
+        if not session.closed:
+            try:
+                await session.close()
+            except Exception:
+                pass
+
+
+async def shutdown_all():
+    """
+    Close every shared session that belongs to the running loop, whatever its refcount.
+    Application exit only: sessions still held by live translators stop working.
+    """
+    loop = asyncio.get_running_loop()
+    with _SESSION_REGISTRY_LOCK:
+        keys = [k for k in _SESSION_REGISTRY if k[0] is loop]
+        sessions = [_SESSION_REGISTRY.pop(k)[0] for k in keys]
+    await _close_sessions(sessions + _pop_stale_sessions())
+
+
+class _ParseError(Exception):
+    """Google response did not have the expected [[[translated, original, ...], ...], ...] shape."""
+
+
+def _join_google_segments(data) -> str:
+    """Join the translated segments of a /translate_a/single response; raises _ParseError on bad shape.
+
+    Empty payloads (soft-ban 200s: ``None``, ``[]``, ``[None, ...]``) are an expected miss and
+    return "" without going through the exception machinery.
+    """
+    if not data or type(data) is not list or not data[0]:
+        if data and type(data) is not list:
+            raise _ParseError(f"Unexpected response type: {type(data).__name__}")
+        return ""
+    try:
+        return ''.join(part[0] for part in data[0] if part and part[0])
+    except (TypeError, IndexError, KeyError) as e:
+        raise _ParseError(f"Unexpected response structure: {e!r}") from e
+
+
+async def _read_json(resp) -> object:
+    """
+    Decode a response body as JSON from raw bytes (orjson when available), ignoring content-type.
+
+    Returns None for an empty or non-JSON body (Google sometimes answers 200 with
+    nothing/HTML), so callers treat it like an empty response instead of an error.
+    """
+    body = await resp.read()
+    if not body or not body.strip():
+        return None
+    try:
+        return _json_loads(body)
+    except ValueError:  # json.JSONDecodeError ve orjson.JSONDecodeError ValueError alt sınıfı
+        return None
+
+
+class _HTTPStatusError(RuntimeError):
+    """Non-200 response from _make_request; keeps the status code for retry decisions."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _CreditSemaphore:
+    """
+    Minimal credit-based semaphore for rate-limited endpoints.
+
+    Each transaction consumes ``credits`` (e.g. proportional to request size)
+    which are refunded ``refund_time`` seconds after it finishes, so the
+    sustained cost per window stays under ``total`` regardless of how the
+    work is split into requests.
+    """
+
+    def __init__(self, total: int):
+        self._total = max(1, int(total))
+        self._available = self._total
+        self._waiters: deque = deque()  # (future, credits), FIFO
+
+    def _wake(self):
+        # Sıradaki bekleyenlere yeterli kredi oldukça FIFO sırasıyla izin ver
+        while self._waiters:
+            fut, credits = self._waiters[0]
+            if fut.done():
+                self._waiters.popleft()
+                continue
+            if self._available < credits:
+                break
+            self._waiters.popleft()
+            self._available -= credits
+            fut.set_result(None)
+
+    def _refund(self, credits: int):
+        """Plain callback (no coroutine/task) so call_later leaves nothing pending."""
+        self._available += credits
+        self._wake()
+
+    async def _acquire(self, credits: int):
+        if not self._waiters and self._available >= credits:
+            self._available -= credits
+            return
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append((fut, credits))
+        try:
+            await fut
+        except BaseException:
+            if fut.done() and not fut.cancelled():
+                self._refund(credits)  # Kredi verildi ama iptal edildik; geri ver
+            else:
+                self._wake()
+            raise
+
+    async def transact(self, coro, credits: int = 1, refund_time: float = 1.0):
+        credits = max(1, min(int(credits), self._total))
+        try:
+            await self._acquire(credits)
+        except BaseException:
+            coro.close()  # never started; avoid "coroutine was never awaited"
+            raise
+        try:
+            return await coro
+        finally:
+            if refund_time > 0:
+                asyncio.get_running_loop().call_later(refund_time, self._refund, credits)
+            else:
+                self._refund(credits)
+
+
 class BaseTranslator(ABC):
+    # Varsayılan translate_batch için eşzamanlı translate_single üst sınırı;
+    # paralel yükü kaldıramayan motorlar (yerel LLM, sıkı hız limitli API) 1 yapar
+    max_parallel_singles = 16
+
     def __init__(self, api_key: Optional[str] = None, proxy_manager=None, config_manager=None):
         self.api_key = api_key
         self.proxy_manager = proxy_manager
         self.config_manager = config_manager
+        # Proxy durumu tek bir Event üzerinden okunur; TranslationManager kendi
+        # Event'ini tüm çevirmenlere bağlar, böylece aç/kapa O(1) olur.
+        self._proxy_flag = threading.Event()
         self.use_proxy = True
         self.logger = logging.getLogger(self.__class__.__name__)
         self.status_callback: Optional[Callable[[str, str], None]] = None  # (level, message)
         self.should_stop_callback: Optional[Callable[[], bool]] = None
         self._session: Optional[aiohttp.ClientSession] = None
-        self._connector: Optional[aiohttp.TCPConnector] = None
-        self._session_lock = asyncio.Lock() # Mutex for thread-safe session creation checks
+        self._session_key: Optional[tuple] = None  # Key into the shared session registry
         self.user_agents = USER_AGENTS
 
+    # emit_log seviye adı -> logging seviyesi (listede olmayanlar INFO olarak yazılır)
+    _EMIT_LOG_LEVELS = {'error': logging.ERROR, 'warning': logging.WARNING}
+
     def emit_log(self, level: str, message: str):
         """Emits log to both standard logger and UI status callback."""
-        # ... logic as before ...
-        if level.lower() == 'error':
-            self.logger.error(message)
-        elif level.lower() == 'warning':
-            self.logger.warning(message)
-        else:
-            self.logger.info(message)
+        self.logger.log(self._EMIT_LOG_LEVELS.get(level.lower(), logging.INFO), message)
             
         if self.status_callback:
             self.status_callback(level, message)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """
-        Get or create a reused client session with optimized TCP/DNS settings.
-        Implemented with Double-Checked Locking to prevent race conditions in high concurrency.
+        Get the process-wide shared client session for the running loop.
+        The session (and its connection pool) is shared by all translators;
+        this instance holds one reference until close().
         """
-        if self._session and not self._session.closed:
+        loop = asyncio.get_running_loop()
+        if self._session and not self._session.closed and self._session_key and self._session_key[0] is loop:
             return self._session
 
-        async with self._session_lock:
-            # Second check inside lock
-            if self._session and not self._session.closed:
-                return self._session
-                
-            # TCP Connector Optimization
-            self._connector = aiohttp.TCPConnector(
-                limit=100,
-                limit_per_host=20,
-                ttl_dns_cache=300,
-                use_dns_cache=True,
-                force_close=False, 
-                enable_cleanup_closed=True
-            )
-            
-            timeout = aiohttp.ClientTimeout(total=45, connect=10, sock_read=30)
-            
-            headers = {
-                'Connection': 'keep-alive'
-            }
-            if hasattr(self, 'user_agents') and self.user_agents:
-                headers['User-Agent'] = random.choice(self.user_agents)
-
-            self._session = aiohttp.ClientSession(
-                connector=self._connector,
-                timeout=timeout,
-                headers=headers
-            )
-            return self._session
+        # Previous session belonged to another (likely closed) loop or was closed: drop our reference
+        self._release_session_ref()
+        await _close_sessions(_pop_stale_sessions())
+        self._session_key, self._session = _acquire_shared_session(loop, _SESSION_TIMEOUT)
+        return self._session
+
+    def _release_session_ref(self) -> Optional[aiohttp.ClientSession]:
+        """Drop this instance's registry reference; return the session if nobody else uses it."""
+        key = self._session_key
+        self._session = None
+        self._session_key = None
+        if key is None:
+            return None
+        return _release_shared_session(key)
 
     def _get_text(self, key: str, default: str, **kwargs) -> str:
         """Helper to get localized text from config_manager."""
@@ -146,46 +334,101 @@ class BaseTranslator(ABC):
             return default
 
     async def close(self):
-        if self._session:
+        # Shared session: only the last user actually closes it
+        session = self._release_session_ref()
+        if session and not session.closed:
             try:
-                await self._session.close()
+                await session.close()
             except Exception:
                 pass
-            self._session = None
-            self._connector = None
 
     async def close_session(self):
         """Alias for close() to match naming convention used in detection logic."""
         await self.close()
 
+    @property
+    def use_proxy(self) -> bool:
+        return self._proxy_flag.is_set()
+
+    @use_proxy.setter
+    def use_proxy(self, enabled: bool):
+        if enabled:
+            self._proxy_flag.set()
+        else:
+            self._proxy_flag.clear()
+
     def set_proxy_enabled(self, enabled: bool):
         self.use_proxy = enabled
 
-    async def _make_request(self, url: str, method: str = "GET", **kwargs):
-        session = await self._get_session()
-        proxy = None
+    def bind_proxy_flag(self, flag: threading.Event):
+        """Share a proxy on/off flag owned by another object (e.g. TranslationManager)."""
+        self._proxy_flag = flag
+
+    def _pick_proxy_url(self) -> Optional[str]:
+        """One round-robin step on the proxy manager; None when proxies are off."""
         if self.use_proxy and self.proxy_manager:
             p = self.proxy_manager.get_next_proxy()
             if p:
-                proxy = p.url
+                return p.url
+        return None
+
+    async def _make_request(self, url: str, method: str = "GET", proxy: Optional[str] = None, **kwargs):
+        session = await self._get_session()
+        if proxy is None:
+            proxy = self._pick_proxy_url()
         if method.upper() == "GET":
             async with session.get(url, proxy=proxy, **kwargs) as resp:
                 if resp.status == 200:
-                    return await resp.json(content_type=None)
-                raise RuntimeError(self._get_text('error_http', f"HTTP {resp.status}", status=resp.status))
+                    return await _read_json(resp)
+                raise _HTTPStatusError(resp.status, self._get_text('error_http', f"HTTP {resp.status}", status=resp.status))
         elif method.upper() == "POST":
             async with session.post(url, proxy=proxy, **kwargs) as resp:
                 if resp.status == 200:
-                    return await resp.json(content_type=None)
-                raise RuntimeError(self._get_text('error_http', f"HTTP {resp.status}", status=resp.status))
+                    return await _read_json(resp)
+                raise _HTTPStatusError(resp.status, self._get_text('error_http', f"HTTP {resp.status}", status=resp.status))
         else:
             raise ValueError(self._get_text('error_unsupported_method', "Unsupported method"))
 
+    async def _request_with_retry(self, url: str, *, attempts: int = 3, base: float = 0.2, **kwargs):
+        """
+        _make_request with exponential backoff + jitter on 5xx and network errors.
+        Retries reuse the shared session, so they ride on the already-warm connection.
+        """
+        for i in range(attempts):
+            try:
+                return await self._make_request(url, **kwargs)
+            except _HTTPStatusError as e:
+                if e.status < 500 or i == attempts - 1:
+                    raise
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if i == attempts - 1:
+                    raise
+            await asyncio.sleep(base * 2 ** i + random.random() * 0.1)
+
     @abstractmethod
     async def translate_single(self, request: TranslationRequest) -> TranslationResult: ...
 
     async def translate_batch(self, requests: List[TranslationRequest]) -> List[TranslationResult]:
-        return [await self.translate_single(r) for r in requests]
+        """Default batch: translate_single per request, bounded-parallel, order preserved."""
+        if not requests:
+            return []
+        sem = asyncio.Semaphore(max(1, self.max_parallel_singles))
+
+        async def _one(r: TranslationRequest) -> TranslationResult:
+            async with sem:
+                return await self.translate_single(r)
+
+        # Bir istekteki hata diğerlerini yarıda bırakmasın; başarısız sonuca çevrilir
+        results = await asyncio.gather(*[_one(r) for r in requests], return_exceptions=True)
+        final_results: List[TranslationResult] = []
+        for req, res in zip(requests, results):
+            if isinstance(res, BaseException):
+                self.logger.debug(f"Batch item failed: {res!r}")
+                res = TranslationResult(
+                    req.text, "", req.source_lang, req.target_lang, req.engine, False, str(res) or type(res).__name__
+                )
+            final_results.append(res)
+        return final_results
 
     @abstractmethod
     def get_supported_languages(self) -> Dict[str, str]: ...
@@ -221,8 +464,19 @@ class GoogleTranslator(BaseTranslator):
     multi_q_concurrency = 16  # Paralel endpoint istekleri
     max_slice_chars = 1800   # Bir istekteki maksimum karakter (URL limit prevent)
     max_texts_per_slice = 25  # Maximum texts per slice
+    # Ayarlardan bağımsız sert üst sınır: çok sayıda kısa metin (menüler) URL'yi
+    # 414'e düşürüp tekil çeviri fallback'ine zorlamasın
+    max_q_per_slice = 128
     use_multi_endpoint = True  # Çoklu endpoint kullan
     enable_lingva_fallback = True  # Lingva fallback aktif
+    result_cache_size = 50_000  # translate_batch çağrıları arası bellek içi LRU kapasitesi
+    # Kredi tabanlı hız sınırı: slice maliyeti = karakter/credit_chars + 1, 1 sn sonra iade
+    credit_budget = 60
+    credit_chars = 500
+    credit_refund_time = 1.0
+    # AIMD: slice RTT/hata penceresine göre multi_q_concurrency otomatik ayarı
+    aimd_window = 64
+    aimd_every = 32
 
     # Mirror Health Check Settings
     MIRROR_MAX_FAILURES = MIRROR_MAX_FAILURES   # Max failures before temp ban
@@ -273,9 +527,16 @@ class GoogleTranslator(BaseTranslator):
         for ep in self.google_endpoints:
             self._endpoint_health[ep] = {'fails': 0, 'banned_until': 0.0}
 
+        # Batch çağrıları arasında tekrar eden metinler için bellek içi LRU:
+        # (sl, tl, original_text) -> (translated_text, confidence). Yalnızca string tutulur;
+        # istek metadata'sı (pipeline entry nesneleri) işler arasında bellekte kalmaz.
+        self._result_cache: OrderedDict = OrderedDict()
+        self.use_result_cache = True
+
         # Load settings from config if available
         if config_manager:
             ts = config_manager.translation_settings
+            self.use_result_cache = getattr(ts, 'use_cache', True)
             self.use_multi_endpoint = getattr(ts, 'use_multi_endpoint', True)
             self.enable_lingva_fallback = getattr(ts, 'enable_lingva_fallback', True)
             # Slider ile kontrol edilen 'max_concurrent_threads' değerini baz alıyoruz
@@ -298,9 +559,114 @@ class GoogleTranslator(BaseTranslator):
             self.use_html_protection = False  # Match config default
             self._google_request_delay = 0.1
             
+        # Ortam değişkeni ile slice limitlerini geçersiz kılma (ayar/sınıf varsayılanından önceliklidir)
+        self.max_slice_chars = self._env_int('RENLOCALIZER_GOOGLE_MAX_SLICE_CHARS', self.max_slice_chars)
+        self.max_q_per_slice = self._env_int('RENLOCALIZER_GOOGLE_MAX_Q_PER_SLICE', self.max_q_per_slice)
+
         # Keep a baseline to restore when proxy adaptasyonu devre dışı
         self._base_multi_q_concurrency = self.multi_q_concurrency
+
+        # Slice RTT / hata geri bildirimi (AIMD); ayarlanan değer sonraki translate_batch'te uygulanır
+        self._rtt_window: deque = deque(maxlen=self.aimd_window)
+        self._err_window: deque = deque(maxlen=self.aimd_window)
+        self._aimd_samples = 0
+        self._tuned_concurrency: Optional[int] = None
+        # Kredi bütçesi translate_batch çağrıları arasında paylaşılır: (semaphore, loop)
+        self._credit_budget: Optional[tuple] = None
+
+    def _get_credit_budget(self) -> _CreditSemaphore:
+        """Kalıcı kredi bütçesi; farklı bir loop'taysak (bekleyen iadeler orada kalır) yenisini kur."""
+        loop = asyncio.get_running_loop()
+        if self._credit_budget is None or self._credit_budget[1] is not loop:
+            self._credit_budget = (_CreditSemaphore(self.credit_budget), loop)
+        return self._credit_budget[0]
+
+    def _record_slice_feedback(self, rtt: float, failed: bool):
+        """Slice sonucunu pencereye ekle; her aimd_every örnekte concurrency'yi ayarla."""
+        self._rtt_window.append(rtt)
+        self._err_window.append(failed)
+        self._aimd_samples += 1
+        if self._aimd_samples % self.aimd_every == 0:
+            self._tune_concurrency()
+
+    def _tune_concurrency(self):
+        """
+        Additive increase (+2) on healthy windows, multiplicative decrease (/2) on bad ones.
+        Never grows past the configured concurrency (max_concurrent_threads).
+        """
+        n = len(self._rtt_window)
+        if not n:
+            return
+        error_rate = sum(self._err_window) / n
+        p95_rtt = sorted(self._rtt_window)[min(n - 1, int(n * 0.95))]
+        old = self._tuned_concurrency or self.multi_q_concurrency
+        new = old
+        if error_rate > 0.15 or p95_rtt > 5.0:
+            new = max(1, old // 2)
+        elif error_rate < 0.05 and p95_rtt < 2.0:
+            new = min(old + 2, self._base_multi_q_concurrency)
+        if new != old:
+            self.logger.info(f"Google AIMD concurrency {old} -> {new} (p95={p95_rtt:.2f}s err={error_rate:.1%})")
+        self._tuned_concurrency = new
     
+    @staticmethod
+    def _build_query(sl: str, tl: str, texts: List[str], use_html: bool = False) -> str:
+        """
+        Build the /translate_a/single query string directly (no urlencode round-trip).
+        Each text is UTF-8 quoted once and joined as repeated q= parameters.
+        """
+        prefix = f"client=gtx&sl={sl}&tl={tl}&dt=t"
+        if use_html:
+            prefix += "&format=html"
+        q_list = [urllib.parse.quote_from_bytes(t.encode('utf-8'), safe='') for t in texts]
+        return f"{prefix}&q={'&q='.join(q_list)}"
+
+    def _env_int(self, name: str, default: int) -> int:
+        value = os.environ.get(name)
+        if not value:
+            return default
+        try:
+            return max(1, int(value))
+        except ValueError:
+            self.logger.warning(f"Ignoring invalid {name}={value!r}")
+            return default
+
+    @staticmethod
+    def _result_cache_key(req: TranslationRequest) -> Tuple[str, str, str]:
+        metadata = req.metadata if isinstance(req.metadata, dict) else {}
+        return (req.source_lang, req.target_lang, metadata.get('original_text', req.text))
+
+    def _result_cache_get(self, req: TranslationRequest) -> Optional[TranslationResult]:
+        if not self.use_result_cache:
+            return None
+        key = self._result_cache_key(req)
+        hit = self._result_cache.get(key)
+        if hit is None:
+            return None
+        self._result_cache.move_to_end(key)
+        translated, confidence = hit
+        return TranslationResult(
+            req.text, translated, req.source_lang, req.target_lang,
+            TranslationEngine.GOOGLE, True, confidence=confidence, metadata=req.metadata
+        )
+
+    def _result_cache_put(self, req: TranslationRequest, res: TranslationResult):
+        # Sadece güvenilir sonuçları sakla: başarısız, geri alınmış (confidence 0)
+        # veya değişmemiş çeviriler bir sonraki denemede tekrar istenebilmeli.
+        if not self.use_result_cache or not res.success or res.confidence <= 0.0:
+            return
+        if res.translated_text.strip() == res.original_text.strip():
+            return
+        key = self._result_cache_key(req)
+        self._result_cache[key] = (res.translated_text, res.confidence)
+        self._result_cache.move_to_end(key)
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def clear_result_cache(self):
+        """Drop in-memory batch results (TranslationManager calls this when its cache is cleared or edited)."""
+        self._result_cache.clear()
+
     async def _get_next_endpoint(self) -> str:
         """Random endpoint selection with health checks and ban cooldown."""
         now = time.time()
@@ -364,7 +730,7 @@ class GoogleTranslator(BaseTranslator):
                 # Reduced timeout to 6s for faster failover
                 async with session.get(url, timeout=aiohttp.ClientTimeout(total=6)) as resp:
                     if resp.status == 200:
-                        data = await resp.json()
+                        data = await _read_json(resp)
                         if data and 'translation' in data:
                             return data['translation']
             except Exception as e:
@@ -381,36 +747,18 @@ class GoogleTranslator(BaseTranslator):
         # Ren'Py değişkenlerini koru (veya pipeline'dan gelen preprotected veriyi kullan)
         protected_text, placeholders, request_use_html = self._prepare_request_protection(request)
 
-        if request_use_html:
-            # HTML wrap protection (Zenpy style)
-            # Add format=html to preserve tags
-            params = {
-                'client':'gtx',
-                'sl':request.source_lang,
-                'tl':request.target_lang,
-                'dt':'t',
-                'q':protected_text,
-                'format':'html'  # IMPORTANT!
-            }
-        else:
-            # Token placeholder mode — uses preprotected data from pipeline
-            # or freshly generated protection from _prepare_request_protection.
-            # CRITICAL: Do NOT re-call protect_renpy_syntax here; that would
-            # double-protect already-tokenised text and cause nested tokens.
-            params = {
-                'client':'gtx',
-                'sl':request.source_lang,
-                'tl':request.target_lang,
-                'dt':'t',
-                'q':protected_text,
-            }
+        # Query is built once per request (sabit client/dt önekine yalnızca sl/tl/q eklenir).
+        # HTML modunda format=html eklenir (Zenpy style). Token modunda pipeline'dan gelen
+        # preprotected veri veya _prepare_request_protection çıktısı kullanılır.
+        # CRITICAL: Do NOT re-call protect_renpy_syntax here; that would
+        # double-protect already-tokenised text and cause nested tokens.
+        query = self._build_query(request.source_lang, request.target_lang, [protected_text], request_use_html)
         
         # Try Google endpoints first (parallel race)
         async def try_endpoint(endpoint: str) -> Optional[str]:
             max_attempts = 3
             for attempt in range(1, max_attempts + 1):
                 try:
-                    query = urllib.parse.urlencode(params, doseq=True, safe='')
                     url = f"{endpoint}?{query}"
                     session = await self._get_session()
                     
@@ -424,19 +772,22 @@ class GoogleTranslator(BaseTranslator):
                     
                     async with session.get(url, proxy=proxy, timeout=aiohttp.ClientTimeout(total=8)) as resp:
                         if resp.status == 200:
-                            data = await resp.json(content_type=None)
-                            if data and isinstance(data, list) and data[0]:
-                                text = ''.join(part[0] for part in data[0] if part and part[0])
-                                # Check for empty/corrupted response (Google sometimes returns 200 with garbage)
-                                if text and len(text.strip()) > 0:
-                                    # Successful translation: Reset failure count and 429 counter
-                                    if endpoint in self._endpoint_health:
-                                        self._endpoint_health[endpoint]['fails'] = 0
-                                    self._consecutive_429_count = max(0, self._consecutive_429_count - 1)
-                                    # Report proxy success
-                                    if proxy_url_used and self.proxy_manager:
-                                        self.proxy_manager.mark_proxy_success(proxy_url_used)
-                                    return text
+                            data = await _read_json(resp)
+                            try:
+                                text = _join_google_segments(data)
+                            except _ParseError as e:
+                                self.logger.debug(f"Google {endpoint}: {e}")
+                                text = ""
+                            # Check for empty/corrupted response (Google sometimes returns 200 with garbage)
+                            if text.strip():
+                                # Successful translation: Reset failure count and 429 counter
+                                if endpoint in self._endpoint_health:
+                                    self._endpoint_health[endpoint]['fails'] = 0
+                                self._consecutive_429_count = max(0, self._consecutive_429_count - 1)
+                                # Report proxy success
+                                if proxy_url_used and self.proxy_manager:
+                                    self.proxy_manager.mark_proxy_success(proxy_url_used)
+                                return text
                             # 200 but empty/no data = soft ban signal from Google
                             if endpoint in self._endpoint_health:
                                 self._endpoint_health[endpoint]['fails'] += 1
@@ -775,40 +1126,33 @@ class GoogleTranslator(BaseTranslator):
                     TranslationEngine.GOOGLE, True, confidence=0.85, metadata=request.metadata
                 )
         
-        # Last resort: sync requests library
+        # Last resort: primary endpoint via the shared session (backoff + jitter)
         try:
-            import requests as req_lib
-            def do():
-                return req_lib.get(
-                    self.google_endpoints[0], 
-                    params=params, 
-                    timeout=5, 
-                    headers={'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-                )
-            resp = await asyncio.to_thread(do)
-            if resp.status_code == 200:
-                data2 = resp.json()
-                if data2 and isinstance(data2, list) and data2[0]:
-                    text = ''.join(part[0] for part in data2[0] if part and part[0])
-                    
-                    if self.use_html_protection:
-                        # Restore using HTML method
-                        final_text = restore_renpy_syntax_html(text)
-                        # HTML mode is safer by default
-                    else:
-                        # Ren'Py değişkenlerini geri koy
-                        final_text = restore_renpy_syntax(text, placeholders)
-                        # BÜTÜNLÜK KONTROLÜ
-                        if placeholders and validate_translation_integrity(final_text, placeholders):
-                             self.logger.warning(f"Integrity check failed (Fallback): Placeholders missing. Using original text.")
-                             final_text = source_text
+            data2 = await self._request_with_retry(
+                f"{self.google_endpoints[0]}?{query}", timeout=aiohttp.ClientTimeout(total=5)
+            )
+            text = _join_google_segments(data2)
+            if text:
+                if self.use_html_protection:
+                    # Restore using HTML method
+                    final_text = restore_renpy_syntax_html(text)
+                    # HTML mode is safer by default
+                else:
+                    # Ren'Py değişkenlerini geri koy
+                    final_text = restore_renpy_syntax(text, placeholders)
+                    # BÜTÜNLÜK KONTROLÜ
+                    if placeholders and validate_translation_integrity(final_text, placeholders):
+                         self.logger.warning(f"Integrity check failed (Fallback): Placeholders missing. Using original text.")
+                         final_text = source_text
 
-                    return TranslationResult(
-                        source_text, final_text, request.source_lang, request.target_lang,
-                        TranslationEngine.GOOGLE, True, confidence=0.8, metadata=request.metadata
-                    )
+                return TranslationResult(
+                    source_text, final_text, request.source_lang, request.target_lang,
+                    TranslationEngine.GOOGLE, True, confidence=0.8, metadata=request.metadata
+                )
+        except _ParseError as e:
+            self.logger.debug(f"Last-resort Google response unusable: {e}")
         except Exception as e:
-            pass
+            self.logger.debug(f"Last-resort Google request failed: {e}")
         
         return TranslationResult(
             source_text, "", request.source_lang, request.target_lang,
@@ -898,26 +1242,20 @@ class GoogleTranslator(BaseTranslator):
             ISO 639-1 language code or None on error
         """
         # Use Google's language detection endpoint
-        params = {
-            'client': 'gtx',
-            'sl': 'auto',
-            'tl': 'en',  # Target doesn't matter for detection
-            'dt': 't',
-            'q': text[:500]  # Limit text length for API efficiency
-        }
+        # Target doesn't matter for detection; limit text length for API efficiency
+        query = self._build_query('auto', 'en', [text[:500]])
         
         try:
             endpoint = await self._get_next_endpoint()
             session = await self._get_session()
             
             async with session.get(
-                endpoint,
-                params=params,
+                f"{endpoint}?{query}",
                 timeout=aiohttp.ClientTimeout(total=5),
                 ssl=False
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json(content_type=None)
+                    data = await _read_json(resp)
                     # Google returns detected language at index [2]
                     # Format: [[["translated", "original", null, null, 10]], null, "detected_lang"]
                     if data and isinstance(data, list) and len(data) > 2:
@@ -929,6 +1267,106 @@ class GoogleTranslator(BaseTranslator):
         
         return None
 
+    async def _translate_pair_batch(
+        self,
+        requests: List[TranslationRequest],
+        sem: asyncio.Semaphore,
+        credits: _CreditSemaphore,
+    ) -> List[TranslationResult]:
+        """Tek dil çiftine ait istekleri dedup + slice + paralel multi-q ile çevir (sıra korunur)."""
+        # Deduplikasyon: tek dict (ekleme sırası korunur) -> text: (unique_index, ilk istek)
+        # orig_to_unique[i] -> i. isteğin unique konumu
+        unique_map: Dict[str, Tuple[int, TranslationRequest]] = {}
+        orig_to_unique: List[int] = []
+        for req in requests:
+            entry = unique_map.get(req.text)
+            if entry is None:
+                entry = unique_map[req.text] = (len(unique_map), req)
+            orig_to_unique.append(entry[0])
+
+        # Önceki batch'lerde çevrilmiş metinleri ağa gitmeden doldur
+        unique_results: List[Optional[TranslationResult]] = [None] * len(unique_map)
+        to_fetch: List[Tuple[int, TranslationRequest]] = []
+        for u_index, req in unique_map.values():
+            hit = self._result_cache_get(req)
+            if hit is not None:
+                unique_results[u_index] = hit
+            else:
+                to_fetch.append((u_index, req))
+
+        # Slice oluştur (karakter limiti + metin sayısı limiti)
+        slices: List[List[Tuple[int, TranslationRequest]]] = []
+        cur: List[Tuple[int, TranslationRequest]] = []
+        cur_chars = 0
+        max_q = min(self.max_texts_per_slice, self.max_q_per_slice)
+        for item in to_fetch:
+            text_len = len(item[1].text)
+            # Hem karakter hem metin sayısı limitini kontrol et
+            if cur and (cur_chars + text_len > self.max_slice_chars or len(cur) >= max_q):
+                slices.append(cur)
+                cur = []
+                cur_chars = 0
+            cur.append(item)
+            cur_chars += text_len
+        if cur:
+            slices.append(cur)
+        
+        self.logger.info(
+            f"Dedup: {len(requests)} -> {len(unique_map)} unique, "
+            f"{len(unique_map) - len(to_fetch)} cached, {len(slices)} slices"
+        )
+
+        # Paralel çalıştır (bounded): çağıranın semaphore'u + karakter bazlı kredi bütçesi
+        async def run_slice(slice_items: List[Tuple[int, TranslationRequest]]):
+            async with sem:
+                reqs = [r for _, r in slice_items]
+                cost = sum(len(r.text) for r in reqs) // self.credit_chars + 1
+                # Slice başına tek proxy: her istekte get_next_proxy() çağrılmaz
+                proxy = self._pick_proxy_url()
+
+                async def timed_multi_q() -> List[TranslationResult]:
+                    # RTT yalnızca isteği ölçer; kredi bekleme süresi AIMD'ye yansımaz
+                    started = time.monotonic()
+                    failed = True
+                    try:
+                        res = await self._multi_q(reqs, proxy=proxy)
+                        failed = not all(r.success for r in res)
+                        return res
+                    finally:
+                        self._record_slice_feedback(time.monotonic() - started, failed)
+
+                # _multi_q girişle aynı uzunlukta döner
+                return await credits.transact(
+                    timed_multi_q(), credits=cost, refund_time=self.credit_refund_time
+                )
+
+        tasks = [asyncio.create_task(run_slice(s)) for s in slices]
+        gathered: List[List[TranslationResult]] = await asyncio.gather(*tasks)
+
+        # Unique sonuç tablosunu doldur (unique sıraya göre)
+        for slice_items, results in zip(slices, gathered):
+            for (u_index, req), res in zip(slice_items, results):
+                unique_results[u_index] = res
+                self._result_cache_put(req, res)
+
+        # Tek geçişte orijinal sıraya dağıt; metadata her istek için ayrı kalır.
+        # Sonucu zaten bu isteğe ait olan (aynı metadata nesnesi, aynı metin) satırlar kopyalanmaz.
+        final_results: List[TranslationResult] = []
+        for u_index, req in zip(orig_to_unique, requests):
+            base_res = unique_results[u_index]
+            if base_res.metadata is req.metadata and base_res.original_text == req.text:
+                final_results.append(base_res)
+            else:
+                final_results.append(dataclasses.replace(
+                    base_res,
+                    original_text=req.text,
+                    source_lang=req.source_lang,
+                    target_lang=req.target_lang,
+                    metadata=req.metadata
+                ))
+        
+        return final_results
+
     async def translate_batch(self, requests: List[TranslationRequest]) -> List[TranslationResult]:
         """Optimize edilmiş toplu çeviri:
         1. Aynı metinleri tek sefer çevir (dedup)
@@ -948,11 +1386,14 @@ class GoogleTranslator(BaseTranslator):
             ):
                 adaptive = self.proxy_manager.get_adaptive_concurrency()
                 adaptive = max(2, min(adaptive, 64))
+                if self._tuned_concurrency:
+                    # Gözlenen RTT/hata geri bildirimi proxy havuzunun önerisini sınırlar
+                    adaptive = min(adaptive, self._tuned_concurrency)
                 self.logger.debug(f"Adaptive concurrency applied: {adaptive}")
                 self.multi_q_concurrency = adaptive
             else:
-                # Proxy yoksa başlangıç değerine dön
-                base = getattr(self, '_base_multi_q_concurrency', None)
+                # Proxy yoksa AIMD değerine, o da yoksa başlangıç değerine dön
+                base = self._tuned_concurrency or getattr(self, '_base_multi_q_concurrency', None)
                 if base:
                     self.multi_q_concurrency = base
         except Exception:
@@ -960,98 +1401,27 @@ class GoogleTranslator(BaseTranslator):
         
         self.logger.info(f"Starting batch translation: {len(requests)} texts, max_slice_chars={self.max_slice_chars}, concurrency={self.multi_q_concurrency}")
         
-        # Dil çifti karışık ise fallback
-        sl = {r.source_lang for r in requests}; tl = {r.target_lang for r in requests}
-        if len(sl) > 1 or len(tl) > 1:
-            return await super().translate_batch(requests)
-
-        # Deduplikasyon
-        indexed = list(enumerate(requests))
-        unique_map: Dict[str, int] = {}
-        unique_list: List[Tuple[int, TranslationRequest]] = []
-        dup_links: Dict[int, int] = {}  # original_index -> unique_index
-        for idx, req in indexed:
-            key = req.text
-            if key in unique_map:
-                dup_links[idx] = unique_map[key]
-            else:
-                u_index = len(unique_list)
-                unique_map[key] = u_index
-                unique_list.append((idx, req))
-                dup_links[idx] = u_index
-
-        # Slice oluştur (karakter limiti + metin sayısı limiti)
-        slices: List[List[Tuple[int, TranslationRequest]]] = []
-        cur: List[Tuple[int, TranslationRequest]] = []
-        cur_chars = 0
-        for item in unique_list:
-            text_len = len(item[1].text)
-            # Hem karakter hem metin sayısı limitini kontrol et
-            if cur and (cur_chars + text_len > self.max_slice_chars or len(cur) >= self.max_texts_per_slice):
-                slices.append(cur)
-                cur = []
-                cur_chars = 0
-            cur.append(item)
-            cur_chars += text_len
-        if cur:
-            slices.append(cur)
-        
-        self.logger.info(f"Dedup: {len(requests)} -> {len(unique_list)} unique, {len(slices)} slices")
-
-        # Paralel çalıştır (bounded)
+        # Semaphore ve kredi bütçesi bir kez kurulur; karışık dil çiftlerinde tüm gruplar
+        # aynı sınırları paylaşır (grup başına ayrı limit eşzamanlılığı katlardı)
         sem = asyncio.Semaphore(self.multi_q_concurrency)
+        credits = self._get_credit_budget()
 
-        async def run_slice(slice_items: List[Tuple[int, TranslationRequest]]):
-            async with sem:
-                reqs = [r for _, r in slice_items]
-                results = await self._multi_q(reqs)
-                # slice içindeki index eşleşmesi (aynı uzunluk varsayımı)
-                return [(slice_items[i][0], results[i]) for i in range(len(results))]
-
-        tasks = [asyncio.create_task(run_slice(s)) for s in slices]
-        gathered: List[List[Tuple[int, TranslationResult]]] = await asyncio.gather(*tasks)
-        # Unique sonuç tablosu (unique sıraya göre)
-        unique_results: Dict[int, TranslationResult] = {}
-        for lst in gathered:
-            for orig_idx, res in lst:
-                # orig_idx burada unique_list içindeki orijinal global indeks değil; unique_list'te kaydettiğimiz idx
-                # slice_items'te (global_index, request) vardı => orig_idx global index
-                # unique index'i bulmak için dup_links'den tersine gerek yok; map oluşturalım
-                # Hız için text'e göre de eşleyebilirdik; burada global index'ten unique index'e gidelim
-                # unique index bul:
-                # performans için bir kere hesaplanıyor
-                pass
+        pair_groups: Dict[Tuple[str, str], List[int]] = {}
+        for idx, r in enumerate(requests):
+            pair_groups.setdefault((r.source_lang, r.target_lang), []).append(idx)
+        if len(pair_groups) == 1:
+            final_results = await self._translate_pair_batch(requests, sem, credits)
+        else:
+            group_indices = list(pair_groups.values())
+            group_results = await asyncio.gather(*[
+                self._translate_pair_batch([requests[i] for i in indices], sem, credits)
+                for indices in group_indices
+            ])
+            final_results: List[TranslationResult] = [None] * len(requests)  # type: ignore
+            for indices, results in zip(group_indices, group_results):
+                for i, res in zip(indices, results):
+                    final_results[i] = res
 
-        # Daha hızlı yol: unique_list sırasına göre slice çıktılarından doldur
-        # unique_list[i][0] = global index; onun sonucunu bulmak için hashedict
-        global_to_result: Dict[int, TranslationResult] = {}
-        for lst in gathered:
-            for global_idx, res in lst:
-                global_to_result[global_idx] = res
-
-        # Şimdi tüm orijinal indeksleri sırayla doldururken dedup'u kopyala
-        final_results: List[TranslationResult] = [None] * len(requests)  # type: ignore
-        for original_idx, req in indexed:
-            unique_idx = dup_links[original_idx]
-            unique_global_index = unique_list[unique_idx][0]
-            base_res = global_to_result[unique_global_index]
-            if base_res is None:
-                # Güvenlik fallback
-                final_results[original_idx] = TranslationResult(req.text, "", req.source_lang, req.target_lang, TranslationEngine.GOOGLE, False, "Missing base result")
-            else:
-                # Aynı referansı paylaşmak yerine kopya (metadata farklı olabilir)
-                final_results[original_idx] = TranslationResult(
-                    original_text=req.text,
-                    translated_text=base_res.translated_text,
-                    source_lang=req.source_lang,
-                    target_lang=req.target_lang,
-                    engine=base_res.engine,
-                    success=base_res.success,
-                    error=base_res.error,
-                    confidence=base_res.confidence,
-                    metadata=req.metadata
-                )
-        
         # POST-BATCH RETRY: Check for unchanged translations and retry them individually
         # Only enabled when aggressive_retry is True (configurable in settings)
         if self.aggressive_retry:
@@ -1101,10 +1471,11 @@ class GoogleTranslator(BaseTranslator):
         "\n###TXTSEP###\n",
     ]
     
-    async def _multi_q(self, batch: List[TranslationRequest]) -> List[TranslationResult]:
+    async def _multi_q(self, batch: List[TranslationRequest], proxy: Optional[str] = None) -> List[TranslationResult]:
         """Batch translation - tries separator method first, falls back to parallel individual.
 
         For better performance, uses parallel individual translation when batch method fails.
+        ``proxy`` is the slice-level proxy picked by the caller; None means pick per request.
         """
         if not batch:
             return []
@@ -1116,7 +1487,7 @@ class GoogleTranslator(BaseTranslator):
         # Separator method dene (daha büyük batch'ler için de)
         # Limit artırıldı: 50 metin, 8000 karakter
         if len(batch) <= 50 and total_chars <= 8000:
-            result = await self._try_batch_separator(batch)
+            result = await self._try_batch_separator(batch, proxy=proxy)
             if result:
                 # ── Batch integrity-fail recovery ──
                 # Batch separator'da token kaybı yaşayan satırları translate_single
@@ -1141,8 +1512,9 @@ class GoogleTranslator(BaseTranslator):
         self.logger.debug(f"Using parallel translation for {len(batch)} texts")
         return await self._translate_parallel(batch)
     
-    async def _try_batch_separator(self, batch: List[TranslationRequest]) -> Optional[List[TranslationResult]]:
+    async def _try_batch_separator(self, batch: List[TranslationRequest], proxy: Optional[str] = None) -> Optional[List[TranslationResult]]:
         """Try batch translation with separator. Returns None if fails."""
+        slice_proxy = proxy
         
         protected_texts = []
         all_placeholders = []  # Her metin için placeholder sözlüğü
@@ -1160,17 +1532,16 @@ class GoogleTranslator(BaseTranslator):
         
         combined_text = self.BATCH_SEPARATOR.join(protected_texts)
         
-        params = {
-            'client': 'gtx',
-            'sl': batch[0].source_lang,
-            'tl': batch[0].target_lang,
-            'dt': 't',
-            'q': combined_text
-        }
-        if use_html:
-            params['format'] = 'html'
-        query = urllib.parse.urlencode(params)
+        query = self._build_query(batch[0].source_lang, batch[0].target_lang, [combined_text], use_html)
         
+        def _fail_proxy(proxy_url: Optional[str]):
+            """Mark the proxy failed; a failed slice proxy is not reused on the next attempt."""
+            nonlocal slice_proxy
+            if proxy_url and self.proxy_manager:
+                self.proxy_manager.mark_proxy_failed(proxy_url)
+            if proxy_url is not None and proxy_url == slice_proxy:
+                slice_proxy = None  # Sonraki deneme _pick_proxy_url() ile yeni proxy seçer
+
         async def try_endpoint(endpoint: str) -> Optional[List[str]]:
             """Try a single endpoint with retries, return list of translations or None."""
             max_attempts = 2  # Fewer retries than translate_single (batch is heavier)
@@ -1179,15 +1550,9 @@ class GoogleTranslator(BaseTranslator):
                     url = f"{endpoint}?{query}"
                     session = await self._get_session()
                     
-                    proxy = None
-                    proxy_url_used = None
-                    if self.use_proxy and self.proxy_manager:
-                        p = self.proxy_manager.get_next_proxy()
-                        if p:
-                            proxy = p.url
-                            proxy_url_used = proxy
+                    proxy_url_used = slice_proxy if slice_proxy is not None else self._pick_proxy_url()
                     
-                    async with session.get(url, proxy=proxy, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+                    async with session.get(url, proxy=proxy_url_used, timeout=aiohttp.ClientTimeout(total=15)) as resp:
                         if resp.status == 429:
                             # 429 = IP-level rate limit — apply global cooldown
                             self._consecutive_429_count += 1
@@ -1198,8 +1563,7 @@ class GoogleTranslator(BaseTranslator):
                                 if self._endpoint_health[endpoint]['fails'] >= self.MIRROR_MAX_FAILURES:
                                     self._endpoint_health[endpoint]['banned_until'] = time.time() + self.MIRROR_BAN_TIME
                                     self.logger.warning(f"Google Mirror BANNED temporarily (2min): {endpoint}")
-                            if proxy_url_used and self.proxy_manager:
-                                self.proxy_manager.mark_proxy_failed(proxy_url_used)
+                            _fail_proxy(proxy_url_used)
                             self.logger.warning(f"Batch-sep 429 on {endpoint}. Global cooldown {global_wait:.0f}s")
                             await asyncio.sleep(global_wait + random.uniform(0.5, 1.0))
                             continue  # Retry after cooldown
@@ -1210,28 +1574,25 @@ class GoogleTranslator(BaseTranslator):
                                 if self._endpoint_health[endpoint]['fails'] >= self.MIRROR_MAX_FAILURES:
                                     self._endpoint_health[endpoint]['banned_until'] = time.time() + self.MIRROR_BAN_TIME
                                     self.logger.warning(f"Google Mirror BANNED temporarily (2min): {endpoint}")
-                            if proxy_url_used and self.proxy_manager:
-                                self.proxy_manager.mark_proxy_failed(proxy_url_used)
+                            _fail_proxy(proxy_url_used)
                             self.logger.debug(f"Batch-sep {endpoint}: HTTP {resp.status}")
                             return None  # Non-retryable HTTP error
                         
-                        data = await resp.json(content_type=None)
-                        segs = data[0] if isinstance(data, list) and data else None
-                        if not segs:
+                        data = await _read_json(resp)
+                        try:
+                            # Combine all translation segments (single join, no repeated concat)
+                            full_translation = _join_google_segments(data)
+                        except _ParseError as e:
+                            self.logger.debug(f"Batch-sep {endpoint}: {e}")
+                            full_translation = ""
+                        if not full_translation:
                             self.logger.debug(f"Batch-sep {endpoint}: No segments in response")
                             # Empty 200 = soft ban signal, count as fail
                             if endpoint in self._endpoint_health:
                                 self._endpoint_health[endpoint]['fails'] += 1
-                            if proxy_url_used and self.proxy_manager:
-                                self.proxy_manager.mark_proxy_failed(proxy_url_used)
+                            _fail_proxy(proxy_url_used)
                             continue  # Retry
                         
-                        # Combine all translation segments
-                        full_translation = ""
-                        for seg in segs:
-                            if seg and seg[0]:
-                                full_translation += seg[0]
-                        
                         # Split by separator
                         parts = full_translation.split(self.BATCH_SEPARATOR)
                         
@@ -1272,8 +1633,7 @@ class GoogleTranslator(BaseTranslator):
                         if self._endpoint_health[endpoint]['fails'] >= self.MIRROR_MAX_FAILURES:
                             self._endpoint_health[endpoint]['banned_until'] = time.time() + self.MIRROR_BAN_TIME
                             self.logger.warning(f"Google Mirror BANNED temporarily (2min): {endpoint} ({str(e)[:50]})")
-                    if proxy_url_used and self.proxy_manager:
-                        self.proxy_manager.mark_proxy_failed(proxy_url_used)
+                    _fail_proxy(proxy_url_used)
                     self.logger.debug(f"Batch-sep failed on {endpoint} (attempt {attempt}): {e}")
                     # Backoff before retry
                     if attempt < max_attempts:
@@ -1611,6 +1971,33 @@ class PseudoTranslator(BaseTranslator):
         }
 
 
+# DeepL'e gönderilen <x i="N"/> yer tutucu etiketleri (boşluk varyasyonları dahil)
+_DEEPL_XML_PH_RE = re.compile(r'<x\s+i\s*=\s*"(\d+)"\s*/>', re.IGNORECASE)
+
+# DeepL'in Ren'Py etiketlerinin içine eklediği boşlukları temizleyen birleşik desen:
+# {i}, {/i}, {plain} gibi basit etiketler | {color=...} gibi değerli etiketler | [variable]
+_DEEPL_RENPY_CLEANUP_RE = re.compile(
+    r'(?P<tag>\{\s*/?\s*(?:i|b|u|s|plain|fast|nw|p|w|cps|color|font|size|alpha|outlinecolor|k|rb|rt)\s*\})'
+    r'|(?P<kv>\{\s*(?P<kname>color|size|font|alpha|outlinecolor|cps|k)\s*=\s*(?P<kval>[^}]+?)\s*\})'
+    r'|(?P<var>\[\s*(?P<vname>[a-zA-Z_][a-zA-Z0-9_]*)\s*\])',
+    re.IGNORECASE
+)
+
+
+def _fix_deepl_renpy_spacing(m: re.Match) -> str:
+    """
+    Replacement callback for _DEEPL_RENPY_CLEANUP_RE.
+
+    Closing tags keep their slash ({ /i } -> {/i}). The old four-pass cleanup
+    rewrote every closing tag, even an intact {/i}, to its opening form ({i}).
+    """
+    if m.group('tag'):
+        return '{' + ''.join(m.group('tag')[1:-1].split()) + '}'
+    if m.group('kv'):
+        return '{' + m.group('kname') + '=' + m.group('kval').strip() + '}'
+    return '[' + m.group('vname') + ']'
+
+
 class DeepLTranslator(BaseTranslator):
     base_url_paid = "https://api.deepl.com/v2/translate"
     base_url_free = "https://api-free.deepl.com/v2/translate"
@@ -1744,48 +2131,30 @@ class DeepLTranslator(BaseTranslator):
                             continue
                         return [TranslationResult(r.text, "", r.source_lang, r.target_lang, TranslationEngine.DEEPL, False, f"DeepL Error: {last_error}", quota_exceeded=is_quota) for r in requests]
 
-                payload = await resp.json(content_type=None)
+                payload = await _read_json(resp) or {}
                 translations = payload.get("translations", [])
                 
                 results = []
                 for i, r in enumerate(requests):
                     if i < len(translations):
                         translated = translations[i].get("text", "")
-                        # Map XML tags back to XRPYX placeholders
-                        final_v = translated
-                        for j, (ph, orig) in enumerate(all_placeholders[i].items()):
-                            xml_tag = f'<x i="{j}"/>'
-                            # Also handle cases where DeepL might add spaces: <x i = "0" />
-                            final_v = final_v.replace(xml_tag, ph)
-                            if ph not in final_v:
-                                # Regex fallback for corrupted tags
-                                pattern = re.compile(rf'<x\s+i\s*=\s*"{j}"\s*/>', re.IGNORECASE)
-                                final_v = pattern.sub(ph, final_v)
+                        # Map XML tags back to XRPYX placeholders in a single scan
+                        # (the pattern also tolerates spacing variants like <x i = "0" />)
+                        phs = list(all_placeholders[i].keys())
+
+                        def _xml_to_ph(m: re.Match, phs=phs) -> str:
+                            j = int(m.group(1))
+                            return phs[j] if j < len(phs) else m.group(0)
+
+                        final_v = _DEEPL_XML_PH_RE.sub(_xml_to_ph, translated) if phs else translated
                         
                         # Apply standard restoration
                         final_text = restore_renpy_syntax(final_v, all_placeholders[i])
                         
                         # --- DeepL Space Cleanup for Ren'Py Tags ---
-                        # Fix common cases where DeepL adds spaces inside Ren'Py tags:
-                        # { i } -> {i}, { b } -> {b}, { /i } -> {/i}, etc.
-                        # This regex finds { tag } patterns and removes internal spaces
-                        renpy_tag_cleanup = [
-                            # {i}, {b}, {u}, {s}, {/i}, {/b}, {/u}, {/s}, {plain}, {/plain}
-                            (r'\{\s*/?\s*(i|b|u|s|plain|fast|nw|p|w|cps|color|font|size|alpha|outlinecolor|k|rb|rt)\s*\}', 
-                             lambda m: '{' + m.group(1).strip().replace(' ', '') + '}'),
-                            # {/i}, {/b} etc with slash
-                            (r'\{\s*/\s*(i|b|u|s|plain|fast|nw|p|w|cps|color|font|size|alpha|outlinecolor|k|rb|rt)\s*\}',
-                             lambda m: '{/' + m.group(1).strip() + '}'),
-                            # {color=...}, {size=...}, {font=...} with values
-                            (r'\{\s*(color|size|font|alpha|outlinecolor|cps|k)\s*=\s*([^}]+?)\s*\}',
-                             lambda m: '{' + m.group(1).strip() + '=' + m.group(2).strip() + '}'),
-                            # [variable] - remove internal spaces: [ variable ] -> [variable]
-                            (r'\[\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*\]',
-                             lambda m: '[' + m.group(1).strip() + ']'),
-                        ]
-                        
-                        for pattern, replacement in renpy_tag_cleanup:
-                            final_text = re.sub(pattern, replacement, final_text, flags=re.IGNORECASE)
+                        # { i } -> {i}, { /i } -> {/i}, {color = #fff} -> {color=#fff}, [ name ] -> [name]
+                        # Tek birleşik regex ile metin yalnızca bir kez taranır.
+                        final_text = _DEEPL_RENPY_CLEANUP_RE.sub(_fix_deepl_renpy_spacing, final_text)
                         
                         # Use original (unprotected) text for TranslationResult
                         meta_i = r.metadata if isinstance(r.metadata, dict) else {}
@@ -1811,15 +2180,17 @@ class DeepLTranslator(BaseTranslator):
             msg = "Quota Exceeded"
         return [TranslationResult(r.text, "", r.source_lang, r.target_lang, TranslationEngine.DEEPL, False, f"DeepL Error: {msg}", quota_exceeded=is_quota) for r in requests]
 
+    SUPPORTED_LANGUAGES = {
+        'bg': 'Bulgarian', 'cs': 'Czech', 'da': 'Danish', 'de': 'German', 'el': 'Greek',
+        'en': 'English', 'es': 'Spanish', 'et': 'Estonian', 'fi': 'Finnish', 'fr': 'French',
+        'hu': 'Hungarian', 'id': 'Indonesian', 'it': 'Italian', 'ja': 'Japanese', 'ko': 'Korean',
+        'lt': 'Lithuanian', 'lv': 'Latvian', 'nb': 'Norwegian', 'nl': 'Dutch', 'pl': 'Polish',
+        'pt': 'Portuguese', 'ro': 'Romanian', 'ru': 'Russian', 'sk': 'Slovak', 'sl': 'Slovenian',
+        'sv': 'Swedish', 'tr': 'Turkish', 'uk': 'Ukrainian', 'zh': 'Chinese'
+    }
+
     def get_supported_languages(self) -> Dict[str,str]:
-        return {
-            'bg': 'Bulgarian', 'cs': 'Czech', 'da': 'Danish', 'de': 'German', 'el': 'Greek',
-            'en': 'English', 'es': 'Spanish', 'et': 'Estonian', 'fi': 'Finnish', 'fr': 'French',
-            'hu': 'Hungarian', 'id': 'Indonesian', 'it': 'Italian', 'ja': 'Japanese', 'ko': 'Korean',
-            'lt': 'Lithuanian', 'lv': 'Latvian', 'nb': 'Norwegian', 'nl': 'Dutch', 'pl': 'Polish',
-            'pt': 'Portuguese', 'ro': 'Romanian', 'ru': 'Russian', 'sk': 'Slovak', 'sl': 'Slovenian',
-            'sv': 'Swedish', 'tr': 'Turkish', 'uk': 'Ukrainian', 'zh': 'Chinese'
-        }
+        return self.SUPPORTED_LANGUAGES
 
 class TranslationManager:
     def __init__(self, proxy_manager=None, config_manager=None):
@@ -1827,6 +2198,9 @@ class TranslationManager:
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
         self.translators: Dict[TranslationEngine, BaseTranslator] = {}
+        # Tüm çevirmenlerin paylaştığı tek proxy bayrağı (varsayılan: açık, BaseTranslator ile aynı)
+        self._proxy_enabled = threading.Event()
+        self._proxy_enabled.set()
         self.should_stop_callback: Optional[Callable[[], bool]] = None
         self.max_retries = 1
         self.retry_delays = [0.1, 0.2, 0.5, 1.0]
@@ -1844,8 +2218,11 @@ class TranslationManager:
             self.use_cache = True
 
         self.cache_capacity = 500000  # Increased from 20k to 500k to support large VNs
+        # Kilit yok: cache işlemlerinin hiçbiri await etmez, event loop üzerinde zaten atomiktir
         self._cache: OrderedDict = OrderedDict()
-        self._cache_lock = asyncio.Lock()
+        # Motor başına kalıcı semaphore: eşzamanlı batch'ler aynı bütçeyi paylaşır.
+        # engine -> (semaphore, limit, loop); limit veya loop değişince yeniden oluşturulur.
+        self._engine_sems: Dict[TranslationEngine, tuple] = {}
         self.cache_hits = 0
         self.cache_misses = 0
         # Adaptive
@@ -1853,31 +2230,83 @@ class TranslationManager:
         self.max_concurrency_cap = 512
         self.min_concurrency_floor = 4
         self._recent_metrics = deque(maxlen=500)
+        # Pencere üzerindeki toplamlar _record_metric içinde güncellenir (O(1) adaptasyon)
+        self._metric_sum_dur = 0.0
+        self._metric_sum_ok = 0
         self._adapt_lock = asyncio.Lock()
         self._last_adapt_time = 0.0
         self.adapt_interval_sec = 5.0
         self.ai_request_delay = 1.5  # Default, will be updated by Pipeline
 
     def add_translator(self, engine: TranslationEngine, translator: BaseTranslator):
+        if isinstance(translator, BaseTranslator):
+            translator.bind_proxy_flag(self._proxy_enabled)
         self.translators[engine] = translator
 
     def remove_translator(self, engine: TranslationEngine):
         self.translators.pop(engine, None)
 
     def set_proxy_enabled(self, enabled: bool):
-        for t in self.translators.values():
-            t.set_proxy_enabled(enabled)
+        # Çevirmenler bayrağı her istekte okur; dolaşmaya gerek yok
+        if enabled:
+            self._proxy_enabled.set()
+        else:
+            self._proxy_enabled.clear()
 
     def set_max_concurrency(self, value: int):
+        # Motor semaphore'ları bir sonraki kullanımda yeni limite göre yeniden boyutlanır
         self.max_concurrent_requests = max(1, int(value))
 
-    async def close_all(self):
+    def _get_engine_semaphore(self, engine: TranslationEngine, limit: int) -> asyncio.Semaphore:
+        """Motorun kalıcı semaphore'u; limit değiştiyse veya farklı bir loop'taysak yenisini kur."""
+        loop = asyncio.get_running_loop()
+        entry = self._engine_sems.get(engine)
+        if entry is None or entry[1] != limit or entry[2] is not loop:
+            entry = (asyncio.Semaphore(limit), limit, loop)
+            self._engine_sems[engine] = entry
+        return entry[0]
+
+    def _clear_engine_result_caches(self):
+        """Motorların bellek içi sonuç cache'lerini boşalt; silinen/düzenlenen çeviri tekrar sunulmasın."""
+        for t in self.translators.values():
+            clear = getattr(t, 'clear_result_cache', None)
+            if clear:
+                clear()
+
+    def clear_cache(self):
+        """Çeviri belleğini (ve motor sonuç cache'lerini) tamamen temizle."""
+        self._cache.clear()
+        self._clear_engine_result_caches()
+
+    def delete_cache_entry(self, key: Tuple[str,str,str,str]) -> bool:
+        """Tek bir cache girdisini sil; girdi yoksa False."""
+        if self._cache.pop(key, None) is None:
+            return False
+        self._clear_engine_result_caches()
+        return True
+
+    def update_cache_entry(self, key: Tuple[str,str,str,str], translated_text: str) -> bool:
+        """Bir cache girdisinin çevirisini değiştir; girdi yoksa False."""
+        res = self._cache.get(key)
+        if res is None:
+            return False
+        res.translated_text = translated_text
+        self._clear_engine_result_caches()
+        return True
+
+    async def close_all(self, shutdown: bool = False):
+        """
+        Release this manager's shared-session references (the last user closes a session).
+        ``shutdown=True`` is for application exit: every registry session on this loop is closed.
+        """
         tasks = []
         for t in self.translators.values():
             if hasattr(t, 'close'):
                 tasks.append(t.close())
         if tasks:
             await asyncio.gather(*tasks, return_exceptions=True)
+        if shutdown:
+            await shutdown_all()
     
     def close_all_sessions(self):
         """
@@ -1885,22 +2314,18 @@ class TranslationManager:
         Called during app shutdown to prevent asyncio cleanup errors.
         """
         try:
-            # Try to get existing event loop
+            # Bu thread'de çalışan bir loop varsa bloklamadan kapatmayı ona planla
+            # (aynı thread'de .result() ile beklemek loop'u kilitlerdi).
             try:
-                loop = asyncio.get_event_loop()
-                if loop and not loop.is_closed():
-                    loop.run_until_complete(self.close_all())
-                    return
+                loop = asyncio.get_running_loop()
             except RuntimeError:
-                pass
-            
-            # If no loop exists, create a temporary one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(self.close_all())
-            finally:
-                loop.close()
+                loop = None
+            if loop is not None:
+                loop.create_task(self.close_all(shutdown=True))
+                return
+
+            # Çalışan loop yok: geçici bir loop ile senkron kapat
+            asyncio.run(self.close_all(shutdown=True))
         except Exception as e:
             # Silent fail - we're shutting down anyway
             self.logger.debug(f"Session cleanup warning: {e}")
@@ -1911,47 +2336,88 @@ class TranslationManager:
         """
         if not self.use_cache:
             return None
-            
-        engine_val, sl, tl, text = key
-        
-        async with self._cache_lock:
-            # 1. Tam Eşleşme (Engine + Langs + Text)
-            val = self._cache.get(key)
+        return self._cache_lookup(key)
+
+    async def _cache_get_many(self, keys) -> Dict[Tuple[str,str,str,str], TranslationResult]:
+        """Birden fazla anahtarı tek geçişte arar; yalnızca bulunanları döndürür."""
+        if not self.use_cache:
+            return {}
+        lookup = self._cache_lookup
+        found: Dict[Tuple[str,str,str,str], TranslationResult] = {}
+        for key in keys:
+            val = lookup(key)
             if val:
-                self._cache.move_to_end(key)
-                return val
-            
-            # 2. Akıllı Dil Eşleşmesi (Kaynak dili 'auto' ise ama cache'de 'en' gibi saklıysa)
-            if sl == "auto":
-                # 'auto' anahtarı ile bulunamadıysa, aynı motor ve hedef dil için herhangi bir kaynak dildeki çeviriye bak.
-                # Not: Büyük cachelerde performans için sadece son 1000 kayda hızlıca bakabiliriz veya kalsın.
-                # Genellikle kullanıcılar tek bir kaynak dilden (örn: ingilizce) çeviri yaptığı için pratik bir çözüm:
-                # Cache anahtarlarını tararken sadece engine, target_lang ve text uyumuna bakıyoruz.
-                for k, v in reversed(self._cache.items()): 
-                    # k: (engine_str, sl, tl, text)
-                    if k[0] == engine_val and k[2] == tl and k[3] == text:
-                        return v
-            
-            # 3. Motor Bağımsız Ebeveyn Eşleşmesi (Cross-Engine)
-            # Eğer Google ile çevrilmiş bir metin varsa ve şu an OpenAI kullanılıyorsa, onu kullan.
-            # (Çeviri kalitesi motorlar arasında benzerdir ve kullanıcıyı maliyetten/beklemeden kurtarır)
-            for k, v in reversed(self._cache.items()):
-                if k[1] == sl and k[2] == tl and k[3] == text:
-                    # Motor farklı olsa bile içerik aynı
+                found[key] = val
+        return found
+
+    def _cache_lookup(self, key: Tuple[str,str,str,str]) -> Optional[TranslationResult]:
+        """_cache_get gövdesi (senkron; arada await olmadığı için kilide gerek yok)."""
+        engine_val, sl, tl, text = key
+
+        # 1. Tam Eşleşme (Engine + Langs + Text)
+        val = self._cache.get(key)
+        if val:
+            self._cache.move_to_end(key)
+            return val
+        
+        # 2. Akıllı Dil Eşleşmesi (Kaynak dili 'auto' ise ama cache'de 'en' gibi saklıysa)
+        if sl == "auto":
+            # 'auto' anahtarı ile bulunamadıysa, aynı motor ve hedef dil için herhangi bir kaynak dildeki çeviriye bak.
+            # Not: Büyük cachelerde performans için sadece son 1000 kayda hızlıca bakabiliriz veya kalsın.
+            # Genellikle kullanıcılar tek bir kaynak dilden (örn: ingilizce) çeviri yaptığı için pratik bir çözüm:
+            # Cache anahtarlarını tararken sadece engine, target_lang ve text uyumuna bakıyoruz.
+            for k, v in reversed(self._cache.items()): 
+                # k: (engine_str, sl, tl, text)
+                if k[0] == engine_val and k[2] == tl and k[3] == text:
                     return v
+        
+        # 3. Motor Bağımsız Ebeveyn Eşleşmesi (Cross-Engine)
+        # Eğer Google ile çevrilmiş bir metin varsa ve şu an OpenAI kullanılıyorsa, onu kullan.
+        # (Çeviri kalitesi motorlar arasında benzerdir ve kullanıcıyı maliyetten/beklemeden kurtarır)
+        for k, v in reversed(self._cache.items()):
+            if k[1] == sl and k[2] == tl and k[3] == text:
+                # Motor farklı olsa bile içerik aynı
+                return v
 
-            return None
+        return None
+
+    @staticmethod
+    def _intern_cache_key(key: Tuple[str,str,str,str]) -> Tuple[str,str,str,str]:
+        """Motor/dil alanlarını intern eder; küçük sözlükten gelen bu stringler tüm anahtarlarda paylaşılır."""
+        engine_val, sl, tl, text = key
+        return (sys.intern(engine_val), sys.intern(sl), sys.intern(tl), text)
 
     async def _cache_put(self, key: Tuple[str,str,str,str], val: TranslationResult):
         if not self.use_cache or not val.success:
             return
-        async with self._cache_lock:
-            self._cache[key] = val
-            self._cache.move_to_end(key)
-            if len(self._cache) > self.cache_capacity:
-                self._cache.popitem(last=False)
+        key = self._intern_cache_key(key)
+        cache = self._cache
+        cache[key] = val
+        cache.move_to_end(key)
+        if len(cache) > self.cache_capacity:
+            cache.popitem(last=False)
+
+    async def _cache_put_many(self, pairs: List[Tuple[Tuple[str,str,str,str], TranslationResult]]):
+        """Birden fazla sonucu tek geçişte cache'e yazar (batch yolu için)."""
+        if not self.use_cache or not pairs:
+            return
+        cache = self._cache
+        intern_key = self._intern_cache_key
+        for key, val in pairs:
+            if not val.success:
+                continue
+            key = intern_key(key)
+            cache[key] = val
+            cache.move_to_end(key)
+        while len(cache) > self.cache_capacity:
+            cache.popitem(last=False)
+
+    async def translate_with_retry(self, req: TranslationRequest, cache_result: bool = True) -> TranslationResult:
+        """Cache'e bak, yoksa translate_single ile (retry'lı) çevir.
 
-    async def translate_with_retry(self, req: TranslationRequest) -> TranslationResult:
+        ``cache_result=False``: başarılı sonucu cache'e yazma; çağıran (translate_batch)
+        sonuçları toplayıp tek seferde _cache_put_many ile yazar.
+        """
         tr = self.translators.get(req.engine)
         if not tr:
             return TranslationResult(req.text, "", req.source_lang, req.target_lang, req.engine, False, f"Translator {req.engine.value} not available")
@@ -1971,8 +2437,9 @@ class TranslationManager:
                 res = await tr.translate_single(req)
                 self.logger.debug("translate_single returned: success=%s, text='%s', error=%s", res.success, (res.translated_text[:50] if res.translated_text else 'EMPTY'), res.error)
                 if res.success:
-                    await self._cache_put(key, res)
-                    self.logger.debug("Added to cache: %s...", cache_text[:30])
+                    if cache_result:
+                        await self._cache_put(key, res)
+                        self.logger.debug("Added to cache: %s...", cache_text[:30])
                     await self._record_metric(time.time() - start, True)
                     return res
                 last_err = res.error
@@ -2009,8 +2476,10 @@ class TranslationManager:
         if self.config_manager and hasattr(self.config_manager, 'translation_settings'):
             is_aggressive = getattr(self.config_manager.translation_settings, 'aggressive_retry_translation', False)
 
+        # Tüm benzersiz anahtarlar tek geçişte aranır
+        cached_map = await self._cache_get_many(unique_req_map)
         for key, indices in unique_req_map.items():
-            cached = await self._cache_get(key)
+            cached = cached_map.get(key)
             
             # Check if cache is valid considering Aggressive Retry
             is_valid_cache = False
@@ -2023,7 +2492,8 @@ class TranslationManager:
             if is_valid_cache:
                 self.cache_hits += 1
                 for idx in indices:
-                    # Kopyala ki metadata bozulmasın
+                    # Kopyala ki metadata bozulmasın; cache isabeti confidence=0.0 ile döner
+                    # (aşağı akış canlı çeviriyi cache'ten buna göre ayırır)
                     final_results[idx] = TranslationResult(
                         original_text=requests[idx].text,
                         translated_text=cached.translated_text,
@@ -2043,6 +2513,9 @@ class TranslationManager:
 
         # 2. Motorlara Göre Grupla (Sadece cache'de olmayanlar)
         groups: Dict[TranslationEngine, List[Tuple[int, TranslationRequest]]] = {}
+        to_cache: List[Tuple[Tuple[str, str, str, str], TranslationResult]] = []
+        # Temsilci indeks -> dedup/cache anahtarı; sonuçlar aranan anahtarla aynı anahtara yazılır
+        rep_keys = {indices[0]: key for key, indices in unique_req_map.items()}
         for idx in remaining_indices:
             req = requests[idx]
             groups.setdefault(req.engine, []).append((idx, req))
@@ -2080,8 +2553,7 @@ class TranslationManager:
                 for (idx, _), res in zip(items, translated_items):
                     final_results[idx] = res
                     if res.success:
-                        key2 = (res.engine.value, res.source_lang, res.target_lang, res.original_text)
-                        await self._cache_put(key2, res)
+                        to_cache.append((rep_keys[idx], res))
             else:
                 # Tekil çeviri akışı
                 concurrency = self.max_concurrent_requests
@@ -2090,12 +2562,12 @@ class TranslationManager:
                     if self.config_manager and hasattr(self.config_manager.translation_settings, 'ai_concurrency'):
                         concurrency = self.config_manager.translation_settings.ai_concurrency
                 
-                sem = asyncio.Semaphore(concurrency)
+                sem = self._get_engine_semaphore(engine, max(1, int(concurrency)))
                 async def run_single(ix: int, rq: TranslationRequest):
                     async with sem:
                         if self.should_stop_callback and self.should_stop_callback():
                             return ix, TranslationResult(rq.text, "", rq.source_lang, rq.target_lang, rq.engine, False, "Stopped by user")
-                        res = await self.translate_with_retry(rq)
+                        res = await self.translate_with_retry(rq, cache_result=False)
                         if is_ai and self.ai_request_delay > 0:
                             await asyncio.sleep(self.ai_request_delay)
                         return ix, res
@@ -2104,8 +2576,10 @@ class TranslationManager:
                 for idx, res in results:
                     final_results[idx] = res
                     if res and res.success:
-                        key2 = (res.engine.value, res.source_lang, res.target_lang, res.original_text)
-                        await self._cache_put(key2, res)
+                        to_cache.append((rep_keys[idx], res))
+
+        # Tüm grupların sonuçlarını tek geçişte cache'e yaz
+        await self._cache_put_many(to_cache)
 
         # 3. Sonuçları kopya (deduplicated) satırlara dağıt
         for key, indices in unique_req_map.items():
@@ -2113,21 +2587,18 @@ class TranslationManager:
             res = final_results[first_idx]
             if res:
                 for other_idx in indices[1:]:
-                    # Metadata korunarak kopyalanır
-                    final_results[other_idx] = TranslationResult(
-                        original_text=requests[other_idx].text,
-                        translated_text=res.translated_text,
-                        source_lang=res.source_lang,
-                        target_lang=res.target_lang,
-                        engine=res.engine,
-                        success=res.success,
-                        error=res.error,
-                        confidence=res.confidence,
-                        metadata=requests[other_idx].metadata
+                    # Metadata korunarak kopyalanır (ilk satır zaten temel sonuç)
+                    final_results[other_idx] = dataclasses.replace(
+                        res, original_text=requests[other_idx].text, metadata=requests[other_idx].metadata
                     )
 
         await self._maybe_adapt_concurrency()
-        return [r if r else TranslationResult(requests[i].text, "", requests[i].source_lang, requests[i].target_lang, requests[i].engine, False, "Translation failed") for i, r in enumerate(final_results)]
+        # Önceden ayrılmış listeyi yerinde tamamla (yalnızca boş kalan yuvalar için sonuç üret)
+        for i, r in enumerate(final_results):
+            if r is None:
+                rq = requests[i]
+                final_results[i] = TranslationResult(rq.text, "", rq.source_lang, rq.target_lang, rq.engine, False, "Translation failed")
+        return final_results  # type: ignore
 
     def get_cache_stats(self) -> Dict[str, float]:
         total = self.cache_hits + self.cache_misses
@@ -2137,7 +2608,15 @@ class TranslationManager:
     async def _record_metric(self, dur: float, ok: bool):
         if not self.adaptive_enabled:
             return
-        self._recent_metrics.append((dur, ok))
+        metrics = self._recent_metrics
+        if len(metrics) == metrics.maxlen:
+            # deque en eski kaydı atacak; toplamlardan düş
+            old_dur, old_ok = metrics[0]
+            self._metric_sum_dur -= old_dur
+            self._metric_sum_ok -= 1 if old_ok else 0
+        metrics.append((dur, ok))
+        self._metric_sum_dur += dur
+        self._metric_sum_ok += 1 if ok else 0
         if len(self._recent_metrics) % 25 == 0:
             await self._maybe_adapt_concurrency()
 
@@ -2169,10 +2648,9 @@ class TranslationManager:
             now2 = time.time()
             if now2 - self._last_adapt_time < self.adapt_interval_sec:
                 return
-            durations = [d for d, _ in self._recent_metrics]
-            successes = [s for _, s in self._recent_metrics]
-            avg_latency = sum(durations) / len(durations)
-            fail_rate = 1 - (sum(1 for s in successes if s) / len(successes))
+            count = len(self._recent_metrics)
+            avg_latency = self._metric_sum_dur / count
+            fail_rate = 1 - (self._metric_sum_ok / count)
             old = self.max_concurrent_requests
             new = old
             
@@ -2275,7 +2753,7 @@ class TranslationManager:
                     for tl, text_map in tl_map.items():
                         if not isinstance(text_map, dict): continue
                         for text, translated in text_map.items():
-                            key = (engine_str, sl, tl, text)
+                            key = self._intern_cache_key((engine_str, sl, tl, text))
                             # Basit validasyon
                             engine_enum = TranslationEngine.GOOGLE
                             if engine_str in [e.value for e in TranslationEngine]:
@@ -2284,8 +2762,8 @@ class TranslationManager:
                             res = TranslationResult(
                                 original_text=text,
                                 translated_text=str(translated),
-                                source_lang=sl,
-                                target_lang=tl,
+                                source_lang=key[1],
+                                target_lang=key[2],
                                 engine=engine_enum,
                                 success=True
                             )
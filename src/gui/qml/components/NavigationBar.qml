@@ -37,54 +37,24 @@ Rectangle {
 
         Item { Layout.preferredHeight: 15 }
 
-        // Ana Menü Öğeleri
-        NavButton {
-            icon: "🏠"
-            tooltip: (backend.uiTrigger, backend.getTextWithDefault("nav_home", "Home"))
-            selected: navRoot.currentIndex === 0
-            onClicked: {
-                navRoot.currentIndex = 0
-                navRoot.pageSelected(0)
-            }
-        }
-
-        NavButton {
-            icon: "🛠"
-            tooltip: (backend.uiTrigger, backend.getTextWithDefault("nav_tools", "Tools"))
-            selected: navRoot.currentIndex === 1
-            onClicked: {
-                navRoot.currentIndex = 1
-                navRoot.pageSelected(1)
-            }
-        }
-
-        NavButton {
-            icon: "📚"
-            tooltip: (backend.uiTrigger, backend.getTextWithDefault("nav_glossary", "Glossary Management"))
-            selected: navRoot.currentIndex === 2
-            onClicked: {
-                navRoot.currentIndex = 2
-                navRoot.pageSelected(2)
-            }
-        }
-
-        NavButton {
-            icon: "🧠"
-            tooltip: (backend.uiTrigger, backend.getTextWithDefault("nav_cache", "Translation Memory (TM)"))
-            selected: navRoot.currentIndex === 3
-            onClicked: {
-                navRoot.currentIndex = 3
-                navRoot.pageSelected(3)
-            }
-        }
-
-        NavButton {
-            icon: "⚙"
-            tooltip: (backend.uiTrigger, backend.getTextWithDefault("nav_settings", "Settings"))
-            selected: navRoot.currentIndex === 4
-            onClicked: {
-                navRoot.currentIndex = 4
-                navRoot.pageSelected(4)
+        // Ana Menü Öğeleri: [ikon, çeviri anahtarı, varsayılan metin]; sayfa indeksi = satır sırası
+        Repeater {
+            model: [
+                ["🏠", "nav_home", "Home"],
+                ["🛠", "nav_tools", "Tools"],
+                ["📚", "nav_glossary", "Glossary Management"],
+                ["🧠", "nav_cache", "Translation Memory (TM)"],
+                ["⚙", "nav_settings", "Settings"]
+            ]
+
+            delegate: NavButton {
+                icon: modelData[0]
+                tooltip: (backend.uiTrigger, backend.getTextWithDefault(modelData[1], modelData[2]))
+                selected: navRoot.currentIndex === index
+                onClicked: {
+                    navRoot.currentIndex = index
+                    navRoot.pageSelected(index)
+                }
             }
         }
 
@@ -98,24 +98,36 @@ ApplicationWindow {
                 id: homePage
             }
 
-            ToolsPage {
+            // Diğer sayfalar ilk ziyarette oluşturulur (açılışta yalnızca HomePage kurulur).
+            // item bir kez yüklendikten sonra 'active' true kalır; sayfa durumu korunur.
+            Loader {
                 id: toolsPage
+                active: stackLayout.currentIndex === 1 || item !== null
+                sourceComponent: Component { ToolsPage {} }
             }
 
-            GlossaryPage {
+            Loader {
                 id: glossaryPage
+                active: stackLayout.currentIndex === 2 || item !== null
+                sourceComponent: Component { GlossaryPage {} }
             }
 
-            CachePage {
+            Loader {
                 id: cachePage
+                active: stackLayout.currentIndex === 3 || item !== null
+                sourceComponent: Component { CachePage {} }
             }
 
-            SettingsPage {
+            Loader {
                 id: settingsPage
+                active: stackLayout.currentIndex === 4 || item !== null
+                sourceComponent: Component { SettingsPage {} }
             }
 
-            AboutPage {
+            Loader {
                 id: aboutPage
+                active: stackLayout.currentIndex === 5 || item !== null
+                sourceComponent: Component { AboutPage {} }
             }
         }
     }
@@ -241,18 +253,17 @@ ApplicationWindow {
             updateDialog.open()
         }
 
-        function onUpdateCheckFinished(hasUpdate, message) {
-            if (!hasUpdate) {
-                warningDialog.title = (backend.uiTrigger, backend.getTextWithDefault("dialog_info_title", "Info"))
-                warningDialog.text = message
-                warningDialog.open()
-            }
-        }
+        // Not: "güncel" / "kontrol başarısız" sonucu backend tarafından logMessage ile de
+        // gönderiliyor ve toast olarak gösteriliyor; ayrıca modal dialog açmaya gerek yok.
     }
 
-    Component.onCompleted: {
-        // Otomatik güncelleme kontrolü
-        backend.checkForUpdates(false)
+    // Otomatik güncelleme kontrolü: ilk kare çizilip pencere göründükten sonra başlat
+    Timer {
+        id: startupUpdateTimer
+        interval: 500
+        running: true
+        repeat: false
+        onTriggered: backend.checkForUpdates(false)
     }
 
     // Güncelleme Dialogu
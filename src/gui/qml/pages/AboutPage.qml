@@ -173,10 +173,19 @@ Rectangle {
                         rowSpacing: 12
                         Layout.fillWidth: true
 
-                        // GitHub Button
-                        LinkButton { label: (backend.uiTrigger, backend.getTextWithDefault("link_github", "📚 GitHub")); onClicked: backend.openUrl("https://github.com/Lord0fTurk/RenLocalizer") }
-                        LinkButton { label: (backend.uiTrigger, backend.getTextWithDefault("link_wiki", "📖 Wiki")); onClicked: backend.openUrl("https://github.com/Lord0fTurk/RenLocalizer/wiki") }
-                        LinkButton { label: (backend.uiTrigger, backend.getTextWithDefault("link_issues", "🐛 Report Bug")); onClicked: backend.openUrl("https://github.com/Lord0fTurk/RenLocalizer/issues") }
+                        // Bağlantılar tek bir tablodan üretilir: [çeviri anahtarı, varsayılan metin, URL]
+                        Repeater {
+                            model: [
+                                ["link_github", "📚 GitHub", "https://github.com/Lord0fTurk/RenLocalizer"],
+                                ["link_wiki", "📖 Wiki", "https://github.com/Lord0fTurk/RenLocalizer/wiki"],
+                                ["link_issues", "🐛 Report Bug", "https://github.com/Lord0fTurk/RenLocalizer/issues"]
+                            ]
+
+                            delegate: LinkButton {
+                                label: (backend.uiTrigger, backend.getTextWithDefault(modelData[0], modelData[1]))
+                                onClicked: backend.openUrl(modelData[2])
+                            }
+                        }
                     }
                 }
             }
@@ -7,7 +7,11 @@ HTML page if needed.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import json
+import os
 import re
+import sys
+import time
 from typing import Optional, Tuple
 
 import requests
@@ -15,6 +19,10 @@ import requests
 
 RELEASES_URL = "https://github.com/Lord0fTurk/RenLocalizer/releases"
 API_URL = "https://api.github.com/repos/Lord0fTurk/RenLocalizer/releases/latest"
+# Last successful check, stored in the config directory. A fresh entry skips the
+# network; an older one is only served as a fallback when the check fails.
+CACHE_FILE = "update_cache.json"
+CACHE_MAX_AGE = 3600  # seconds
 
 
 @dataclass
@@ -88,3 +96,58 @@ def check_for_updates(current_version: str, timeout: int = 10) -> UpdateCheckRes
         release_url=url or RELEASES_URL,
         error=None,
     )
+
+
+def _default_config_dir() -> str:
+    """Application directory (next to the executable when frozen, otherwise the project root)."""
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _cache_path(config_dir: Optional[str] = None) -> str:
+    return os.path.join(config_dir or _default_config_dir(), CACHE_FILE)
+
+
+def load_cached_result(
+    current_version: str,
+    max_age: Optional[float] = CACHE_MAX_AGE,
+    config_dir: Optional[str] = None,
+) -> Optional[UpdateCheckResult]:
+    """Return the last successful check result, or None if missing/too old.
+
+    ``max_age=None`` accepts any age (used as a fallback when the network fails).
+    ``update_available`` is recomputed so an upgrade since the last check is respected.
+    """
+    try:
+        with open(_cache_path(config_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        checked_at = float(data["checked_at"])
+        latest_version = str(data["latest_version"])
+    except Exception:
+        return None
+
+    if max_age is not None and time.time() - checked_at > max_age:
+        return None
+
+    return UpdateCheckResult(
+        current_version=current_version,
+        latest_version=latest_version,
+        update_available=_is_newer(latest_version, current_version),
+        release_url=data.get("release_url") or RELEASES_URL,
+        error=None,
+    )
+
+
+def save_cached_result(result: UpdateCheckResult, config_dir: Optional[str] = None) -> None:
+    if result.error or not result.latest_version:
+        return
+    try:
+        with open(_cache_path(config_dir), "w", encoding="utf-8") as f:
+            json.dump({
+                "checked_at": time.time(),
+                "latest_version": result.latest_version,
+                "release_url": result.release_url,
+            }, f)
+    except OSError:
+        pass